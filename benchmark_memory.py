@@ -0,0 +1,71 @@
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmark_pipeline import generate_dump
+from categorize_jobs import JobTable, iter_jobs
+
+DEFAULT_SIZES = [10000, 100000]
+MODES = ['dicts', 'table']
+
+def legacy_parse_frame(path):
+    """The list of per-job dicts with object columns the parse step used to build"""
+    import pandas as pd
+    jobs = list(iter_jobs(path))
+    return pd.DataFrame(jobs)
+
+def compact_parse_frame(path):
+    """Dictionary-encoded JobTable turned into a DataFrame with categorical columns"""
+    return JobTable(iter_jobs(path)).to_frame()
+
+def measure(path, mode):
+    """Peak traced memory and time of the parse -> DataFrame step in this process"""
+    import pandas  # imported before tracing so only the step itself is counted
+    build = legacy_parse_frame if mode == 'dicts' else compact_parse_frame
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = build(path)
+    seconds = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'rows': len(df), 'seconds': seconds, 'peak_mb': peak / (1 << 20),
+            'frame_mb': df.memory_usage(deep=True).sum() / (1 << 20)}
+
+def run_mode(path, mode):
+    """Measure one mode in a fresh process, so peaks do not include the other mode"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, path, mode).result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure peak memory of parsing a dump into a DataFrame")
+    parser.add_argument('inputs', nargs='*', help="dumps to measure (default: synthetic dumps of --sizes)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="postings per synthetic dump (default: 10000 100000)")
+    args = parser.parse_args(argv)
+
+    print("🧠 Measuring peak memory of parse -> DataFrame (dicts with object columns vs JobTable)...")
+    print(f"   {'input':<24} {'rows':>8} {'mode':<6} {'peak MB':>8} {'frame MB':>9} {'seconds':>8}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        inputs = list(args.inputs)
+        for postings in ([] if args.inputs else args.sizes):
+            path = os.path.join(work_dir, f"synthetic-{postings}.txt")
+            generate_dump(path, postings)
+            inputs.append(path)
+
+        for path in inputs:
+            for mode in MODES:
+                result = dict(run_mode(path, mode), input=os.path.basename(path), mode=mode)
+                results.append(result)
+                print(f"   {result['input']:<24} {result['rows']:>8} {mode:<6} {result['peak_mb']:8.1f} "
+                      f"{result['frame_mb']:9.1f} {result['seconds']:8.2f}")
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from categorize_jobs import (
+    DEDUPE_MODES, JobDeduplicator, add_categories, create_accurate_categorizer, extract_jobs_fields,
+    fix_job_block, iter_chunks, iter_job_blocks, parse_job_block, write_jobs_csv
+)
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [1000, 10000, 100000]
+STAGES = ['read', 'fix', 'parse', 'dedupe', 'extract', 'categorize', 'write']
+
+# Vocabulary for synthetic postings, shaped like the LinkedIn remote-trainee scrape
+COMPANIES = [
+    'Halr', 'Oleve', 'Wanderlog', 'Tempo (YC S23)', 'Canonical', 'Inspired Way', 'Mindrift',
+    'Braintrust', 'Sezzle', 'Toptal', 'Crossover', 'Turing', 'Deel', 'Globant', 'Outlier',
+    'BairesDev', 'Lemon.io', 'Jobgether', 'TELUS Digital', 'Welocalize', 'Appen', 'RWS',
+    'Hostinger', 'Remote.com', 'Mercor', 'DataAnnotation', 'Insight Global', 'Alignerr'
+]
+SENIORITIES = ['', '', 'Junior ', 'Senior ', 'Trainee ', 'Lead ', 'Intern ']
+ROLES = [
+    'Software Engineer', 'Frontend Developer', 'Full-Stack Developer', 'Backend Engineer',
+    'Data Analyst', 'Data Scientist', 'Machine Learning Engineer', 'DevOps Engineer',
+    'QA Tester', 'Customer Support Representative', 'Customer Success Manager',
+    'Sales Development Representative', 'Account Executive', 'Marketing Specialist',
+    'Social Media Manager', 'SEO Specialist', 'UX Designer', 'Graphic Designer',
+    'Recruiter', 'HR Assistant', 'Content Writer', 'Copywriter', 'Virtual Assistant',
+    'Executive Assistant', 'Project Manager', 'Business Analyst', 'Accountant',
+    'Translator', 'Video Editor', 'English Teacher', 'AI Trainer', 'Research Assistant'
+]
+SUFFIXES = [
+    '', '', '', ' (Remote)', ' - LATAM', ' (React, TypeScript)', ' - Contract', ' | Spanish Speaker',
+    ' (Python)', ' - Part Time', ' (Freelance)', ' - REF#281070'
+]
+LOCATIONS = [
+    'Argentina (Remote)', 'Latin America (Remote)', 'Brazil (Remote)', 'Mexico (Remote)',
+    'Buenos Aires, Buenos Aires Province, Argentina (Remote)', 'Colombia (Remote)',
+    'United States (Remote)', 'Spain (Remote)'
+]
+TAGS = ['Actively reviewing applicants', 'Viewed', 'Easy Apply', 'Promoted']
+
+def make_salary(rng):
+    """One salary line in one of the formats the scrape contains"""
+    low = rng.randint(1, 12)
+    style = rng.random()
+    if style < 0.45:
+        return f"${low * 10}K/yr - ${(low + rng.randint(1, 6)) * 10}K/yr"
+    if style < 0.75:
+        return f"${low * 500:,}/month - ${(low + rng.randint(1, 6)) * 500:,}/month"
+    if style < 0.9:
+        return f"${low * 5}/hr - ${(low + rng.randint(1, 4)) * 5}/hr"
+    return f"${low * 10}K/yr"
+
+def make_time_posted(rng):
+    """One posting-age line: hours, days, weeks or months ago"""
+    style = rng.random()
+    if style < 0.2:
+        return f"{rng.randint(1, 23)} hours agoWithin the past 24 hours"
+    if style < 0.6:
+        return f"{rng.randint(1, 6)} days ago"
+    if style < 0.9:
+        return f"{rng.randint(1, 4)} weeks ago"
+    return f"{rng.randint(1, 3)} months ago"
+
+def add_typo(rng, title):
+    """Swap, drop or replace one letter of the title"""
+    i = rng.randrange(len(title) - 1)
+    style = rng.random()
+    if style < 0.4:
+        return title[:i] + title[i + 1] + title[i] + title[i + 2:]
+    if style < 0.7:
+        return title[:i] + title[i + 1:]
+    return title[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + title[i + 1:]
+
+def generate_dump(path, postings, duplicate_rate=0.9, typo_rate=0.02, salary_rate=0.35,
+                  time_rate=0.95, seed=0):
+    """Write a deterministic synthetic dump in the remote-trainee-jobs.txt block format
+
+    duplicate_rate is the share of position lines repeated LinkedIn-style (TitleTitle,
+    sometimes with a " with verification" suffix), typo_rate the share of titles with one
+    typo, and salary_rate/time_rate the share of blocks with a salary/posting-age line.
+    """
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(postings):
+            company = rng.choice(COMPANIES)
+            title = rng.choice(SENIORITIES) + rng.choice(ROLES) + rng.choice(SUFFIXES)
+            if rng.random() < typo_rate:
+                title = add_typo(rng, title)
+            position = title
+            if rng.random() < duplicate_rate:
+                position = title + title + (' with verification' if rng.random() < 0.2 else '')
+
+            lines = [f"{company} logo", position, company, rng.choice(LOCATIONS)]
+            if rng.random() < salary_rate:
+                lines.append(make_salary(rng))
+            if rng.random() < time_rate:
+                lines.append(make_time_posted(rng))
+            lines.extend(tag for tag in TAGS if rng.random() < 0.25)
+            if i:
+                f.write('\n\n')
+            f.write('\n'.join(lines))
+        f.write('\n')
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+def benchmark_dump(input_path, output_path, chunk_size=2000, dedupe='exact'):
+    """Run the pipeline over a dump stage by stage and time every stage
+
+    Blocks are processed in chunks of chunk_size like the streaming pipeline, with
+    duplicates dropped in the given DEDUPE_MODES mode. Time spent by write_jobs_csv
+    outside the row generator is the write stage.
+    """
+    # Compiling the rules and the lazy pandas import are one-off setup, not stage time
+    start = time.perf_counter()
+    categorizer = create_accurate_categorizer()
+    deduplicator = JobDeduplicator(dedupe)
+    extract_jobs_fields([])
+    setup_seconds = time.perf_counter() - start
+
+    seconds = dict.fromkeys(STAGES, 0.0)
+    rows_in = dict.fromkeys(STAGES, 0)
+    rows_out = dict.fromkeys(STAGES, 0)
+
+    def rows():
+        chunks = iter_chunks(iter_job_blocks(input_path), chunk_size)
+        while True:
+            t0 = time.perf_counter()
+            blocks = next(chunks, None)
+            if blocks is None:
+                seconds['read'] += time.perf_counter() - t0
+                return
+            t1 = time.perf_counter()
+            fixed = [block for block in map(fix_job_block, blocks) if block is not None]
+            t2 = time.perf_counter()
+            parsed = [job for job in map(parse_job_block, fixed) if job is not None]
+            t3 = time.perf_counter()
+            jobs = deduplicator.filter(parsed)
+            t4 = time.perf_counter()
+            extract_jobs_fields(jobs)
+            t5 = time.perf_counter()
+            add_categories(jobs, categorizer)
+            t6 = time.perf_counter()
+
+            for stage, elapsed, count_in, count_out in [
+                ('read', t1 - t0, len(blocks), len(blocks)),
+                ('fix', t2 - t1, len(blocks), len(fixed)),
+                ('parse', t3 - t2, len(fixed), len(parsed)),
+                ('dedupe', t4 - t3, len(parsed), len(jobs)),
+                ('extract', t5 - t4, len(jobs), len(jobs)),
+                ('categorize', t6 - t5, len(jobs), len(jobs)),
+            ]:
+                seconds[stage] += elapsed
+                rows_in[stage] += count_in
+                rows_out[stage] += count_out
+            yield from jobs
+
+    start = time.perf_counter()
+    total = write_jobs_csv(rows(), output_path)
+    wall_seconds = time.perf_counter() - start
+    seconds['write'] = wall_seconds - sum(seconds[stage] for stage in STAGES if stage != 'write')
+    rows_in['write'] = rows_out['write'] = total
+
+    return {
+        'blocks': rows_in['read'],
+        'jobs': total,
+        'setup_seconds': setup_seconds,
+        'wall_seconds': wall_seconds,
+        'rows_per_second': total / wall_seconds if wall_seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': {
+            stage: {
+                'seconds': seconds[stage],
+                'rows_in': rows_in[stage],
+                'rows_out': rows_out[stage],
+                'rows_per_second': rows_in[stage] / seconds[stage] if seconds[stage] > 0 else None
+            }
+            for stage in STAGES
+        }
+    }
+
+def git_commit():
+    """Current commit of the checkout, so results can be compared between commits"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_size(postings, work_dir, generator, chunk_size, dedupe='exact'):
+    """Generate one dump and benchmark it in a fresh process, so peak memory is per size"""
+    input_path = os.path.join(work_dir, f"synthetic-{postings}.txt")
+    output_path = os.path.join(work_dir, f"synthetic-{postings}.csv")
+    if not os.path.exists(input_path):
+        generate_dump(input_path, postings, **generator)
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        result = executor.submit(benchmark_dump, input_path, output_path, chunk_size, dedupe).result()
+    result['postings'] = postings
+    result['dump_bytes'] = os.path.getsize(input_path)
+    return result
+
+def compare_results(baseline, results):
+    """Print per-stage speed-ups and memory change against a baseline results file"""
+    print(f"\n📐 Compared with {baseline.get('commit') or 'baseline'}:")
+    old_runs = {run['postings']: run for run in baseline['runs']}
+    for run in results['runs']:
+        old = old_runs.get(run['postings'])
+        if old is None:
+            continue
+        speedups = ', '.join(
+            f"{stage} {old['stages'][stage]['seconds'] / run['stages'][stage]['seconds']:.2f}x"
+            for stage in STAGES if run['stages'][stage]['seconds'] > 0 and stage in old['stages']
+        )
+        print(f"   {run['postings']:>9} postings: total {old['wall_seconds'] / run['wall_seconds']:.2f}x, "
+              f"{speedups}; peak RSS {old['peak_rss_mb']:.0f} -> {run['peak_rss_mb']:.0f} MB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the job pipeline on synthetic LinkedIn dumps")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="postings per synthetic dump, e.g. 1000 10000 ... 10000000")
+    parser.add_argument('--duplicate-rate', type=float, default=0.9, help="share of duplicated titles")
+    parser.add_argument('--typo-rate', type=float, default=0.02, help="share of titles with a typo")
+    parser.add_argument('--salary-rate', type=float, default=0.35, help="share of postings with a salary line")
+    parser.add_argument('--time-rate', type=float, default=0.95, help="share of postings with a posting-age line")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--dedupe', choices=DEDUPE_MODES, default='exact',
+                        help="duplicate postings to drop, as in categorize_jobs.py (default: exact)")
+    parser.add_argument('--work-dir', help="keep generated dumps here and reuse them (default: a temp dir)")
+    parser.add_argument('--output', default='benchmark_results.json', help="machine-readable results file")
+    parser.add_argument('--compare', metavar='PATH', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    generator = {
+        'duplicate_rate': args.duplicate_rate, 'typo_rate': args.typo_rate,
+        'salary_rate': args.salary_rate, 'time_rate': args.time_rate, 'seed': args.seed
+    }
+    results = {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'generator': generator,
+        'chunk_size': args.chunk_size,
+        'dedupe': args.dedupe,
+        'runs': []
+    }
+
+    print("⏱️ Benchmarking the pipeline on synthetic dumps...")
+    print(f"   {'postings':>9} {'wall (s)':>9} {'rows/s':>10} {'peak MB':>8}  " +
+          ' '.join(f"{stage:>10}" for stage in STAGES))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = args.work_dir or temp_dir
+        os.makedirs(work_dir, exist_ok=True)
+        for postings in args.sizes:
+            run = run_size(postings, work_dir, generator, args.chunk_size, args.dedupe)
+            results['runs'].append(run)
+            print(f"   {postings:>9} {run['wall_seconds']:9.2f} {run['rows_per_second']:10.0f} "
+                  f"{run['peak_rss_mb']:8.0f}  " +
+                  ' '.join(f"{run['stages'][stage]['seconds']:10.3f}" for stage in STAGES))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), results)
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import re
+import time
+
+from categorize_jobs import fix_duplicated_title
+
+# Title lengths to time; the legacy routine is only run up to LEGACY_MAX_LENGTH
+LENGTHS = [1000, 2000, 4000, 8000, 16000, 32000]
+LEGACY_MAX_LENGTH = 4000
+
+def legacy_fix_duplicated_title(position):
+    """The prefix-slicing and backtracking-regex repair this routine replaced"""
+    if len(position) > 10:
+        for i in range(1, len(position) // 2 + 1):
+            if position[:i] == position[i:2*i]:
+                if i == len(position) // 2 or position[i-1] == ' ' or position[i] == ' ':
+                    position = position[:i]
+                    break
+
+        patterns = [
+            (r'(.+?)\1', r'\1'),
+            (r'(.+?)\s+\1', r'\1'),
+            (r'^(.+?)(?=\1)', r'\1'),
+        ]
+        for pattern, replacement in patterns:
+            new_position = re.sub(pattern, replacement, position)
+            if new_position != position:
+                position = new_position
+                break
+
+    return position
+
+def square_free(length):
+    """Ternary square-free word (derived from Thue-Morse): no duplicate anywhere to find"""
+    thue_morse = [bin(i).count('1') % 2 for i in range(length + 2)]
+    return ''.join('abc'[thue_morse[i + 1] - thue_morse[i] + 1] for i in range(length))
+
+def adversarial_titles(length):
+    """Long titles that stress the duplicate search in different ways"""
+    words = ('Senior Software Engineer React TypeScript Remote LATAM ' * (length // 50 + 1))[:length // 2]
+    return {
+        'square_free': square_free(length),
+        'single_char': 'a' * length,
+        'periodic': 'ab' * (length // 2),
+        'near_duplicate': words + words[:-1] + 'x',
+        'duplicate_with_suffix': words + words + ' with verification',
+    }
+
+def time_call(function, title):
+    start = time.perf_counter()
+    function(title)
+    return time.perf_counter() - start
+
+def main():
+    print("⏱️ Benchmarking duplicated-title repair on adversarial long titles...")
+    print(f"   {'case':<22} {'length':>7} {'linear (ms)':>12} {'legacy (ms)':>12}")
+
+    for length in LENGTHS:
+        for case, title in adversarial_titles(length).items():
+            linear = time_call(fix_duplicated_title, title) * 1000
+            if length <= LEGACY_MAX_LENGTH:
+                legacy = f"{time_call(legacy_fix_duplicated_title, title) * 1000:12.2f}"
+            else:
+                legacy = f"{'skipped':>12}"
+            print(f"   {case:<22} {len(title):>7} {linear:12.2f} {legacy}")
+
+if __name__ == "__main__":
+    main()
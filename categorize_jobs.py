@@ -1,134 +1,404 @@
-import pandas as pd
+import argparse
+import csv
+import glob
+import hashlib
+import importlib.util
+import json
+import mmap
+import os
+import pickle
 import re
-from collections import defaultdict
+import string
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from itertools import chain
 
-def fix_duplicated_titles():
-    """Fix duplicated titles in the raw job data"""
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+# numpy, pandas and the modules only some modes need (process pool, SQLite store,
+# profiler) are imported where they are used, so categorizing a few titles (see
+# categorize_titles) starts without paying for them
+
+# Category rule tables, and where their compiled form is cached (keyed on the file hash)
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'category_rules.json')
+COMPILED_RULES_VERSION = '5'  # bump whenever CategoryRules compiles rules differently
+
+# matched_keywords holds the keys of the matched rules (see rule_key) joined by
+# MATCH_SEPARATOR; the rule dictionary written next to the output resolves them
+# (RESULT_ENCODING is part of the fingerprint)
+MATCH_SEPARATOR = ';'
+RESULT_ENCODING = 'rule-keys'
+RULE_DICTIONARY_VERSION = 2
+
+# Title normalization shared by every categorizer entry point
+NON_WORD_RE = re.compile(r'[^\w\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Data Science only gives full weight to keywords containing one of these terms
+DATA_SCIENCE_PRIMARY_TERMS = [
+    'data scientist', 'data analyst', 'machine learning', 'ml engineer', 'ai engineer',
+    'statistician', 'bi analyst', 'analytics engineer', 'data engineer', 'research scientist',
+    'quantitative analyst'
+]
+DATA_SCIENCE_TECH_TERMS = [
+    'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit', 'jupyter', 'spark', 'hadoop',
+    'tableau', 'power bi', 'matplotlib', 'seaborn', 'plotly', 'r', 'sas', 'spss', 'stata'
+]
+
+# Typo tolerance: title words are corrected to rule words starting with the same letter
+# within an edit distance that grows with the word length; words longer than
+# TYPO_MAX_WORD_LENGTH are left alone. So are real words in TYPO_KNOWN_WORDS that sit one
+# edit from a rule word, and words that are another inflection of the same stem as the
+# rule word (network/networks, operational/operations, procesos/process)
+TYPO_DISTANCE_BY_LENGTH = [(5, 0), (10, 1)]   # (up to this length, distance); longer -> 2
+TYPO_MAX_DISTANCE = 2
+TYPO_MAX_WORD_LENGTH = 24
+TYPO_KNOWN_WORDS = frozenset(['sprint', 'waiter', 'consultancy'])
+INFLECTION_ENDINGS = frozenset(['', 's', 'es', 'e', 'a', 'as', 'o', 'os', 'al', 'ed', 'er', 'ing'])
+TYPO_SETTINGS = repr((TYPO_DISTANCE_BY_LENGTH, TYPO_MAX_DISTANCE, TYPO_MAX_WORD_LENGTH,
+                      sorted(TYPO_KNOWN_WORDS), sorted(INFLECTION_ENDINGS)))
+
+def open_input(path):
+    """Open a dump for reading as text; '-' reads standard input"""
+    if path == '-':
+        return nullcontext(sys.stdin)
+    return open(path, 'r', encoding='utf-8')
+
+def expand_inputs(patterns):
+    """Resolve input files, globs and '-' (stdin) to an ordered list of paths
     
-    print("🔧 Fixing duplicated titles in raw data...")
+    Paths keep the order they are given in and every glob expands in sorted order, so
+    merged output is deterministic. A path given twice is only read once. A missing
+    path or a glob without matches raises FileNotFoundError.
+    """
+    paths = []
+    for pattern in patterns:
+        if pattern != '-' and any(char in pattern for char in '*?['):
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise FileNotFoundError(f"No input files match {pattern}")
+            paths.extend(matches)
+        else:
+            if pattern != '-' and not os.path.exists(pattern):
+                raise FileNotFoundError(f"No such input file: {pattern}")
+            paths.append(pattern)
+    return list(dict.fromkeys(paths))
+
+def iter_input_blocks(paths):
+    """Job blocks of one dump or of several dumps read one after the other"""
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        yield from iter_job_blocks(path)
+
+def iter_job_blocks(path, chunk_size=1 << 20):
+    """Yield the blank-line separated job blocks of a dump without reading it whole
     
-    # Read the raw data
-    with open('remote-trainee-jobs.txt', 'r', encoding='utf-8') as f:
-        content = f.read()
+    Blocks come out exactly as splitting the whole file on blank lines would return
+    them. Regular files are memory-mapped (see iter_job_blocks_mmap) and stdin is read
+    chunk_size characters at a time.
+    """
+    if path != '-' and os.path.isfile(path):
+        return iter_job_blocks_mmap(path, window=chunk_size)
+    return _iter_job_blocks_stream(path, chunk_size)
+
+def _iter_job_blocks_stream(path, chunk_size, offset=0):
+    """Text-mode reader holding one chunk and the block in progress in memory"""
+    with open_input(path) as f:
+        if offset:
+            f.seek(offset)
+        pending = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            blocks = (pending + chunk).split('\n\n')
+            pending = blocks.pop()
+            yield from blocks
+        yield pending
+
+def _has_carriage_returns(path):
+    """Text mode turns \\r\\n and \\r into \\n, which a byte-level block scan cannot see"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                return False
+            if b'\r' in chunk:
+                return True
+
+def iter_job_blocks_mmap(path, start=0, end=None, window=1 << 20):
+    """Yield the job blocks of a memory-mapped dump, or of its byte range [start, end)
     
-    # Split into job blocks (separated by double newlines)
-    job_blocks = content.split('\n\n')
+    Blank-line boundaries are found on the raw bytes ('\\n' never occurs inside a
+    multi-byte UTF-8 character) one window at a time and each block is decoded only when
+    it is consumed. Pages already consumed are dropped from the mapping where the OS
+    allows it, so memory stays at about one window whatever the file size. A range must
+    start and end on the cuts job_block_ranges returns; the ranges of a file together
+    yield exactly the blocks of the whole file. Text mode would translate \\r line
+    endings, so a whole-file read switches to the text-mode reader at the first block
+    containing one and a range read raises ValueError.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else end
+        if size == 0:
+            yield ''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            can_release = hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')
+            pending = b''
+            position = start
+            while position < end:
+                window_end = min(position + window, end)
+                chunk = mm[position:window_end]
+                if b'\r' in chunk:
+                    if start != 0 or end != size:
+                        raise ValueError(f"{path} has \\r line endings, which only iter_job_blocks can read")
+                    yield from _iter_job_blocks_stream(path, window, position - len(pending))
+                    return
+                blocks = (pending + chunk).split(b'\n\n')
+                pending = blocks.pop()
+                for block in blocks:
+                    yield block.decode('utf-8')
+                if can_release:
+                    page_start = position - position % mmap.PAGESIZE
+                    mm.madvise(mmap.MADV_DONTNEED, page_start, window_end - page_start)
+                position = window_end
+            yield pending.decode('utf-8')
+
+def job_block_ranges(path, range_bytes=1 << 22):
+    """Split a dump into byte ranges of about range_bytes that end on block boundaries
     
-    fixed_jobs = []
+    Only the bytes around each cut are looked at, so workers can each read their own
+    range with iter_job_blocks_mmap without the file being read here. Cuts follow the
+    left-to-right blank-line split, even inside runs of several blank lines. Returns a
+    list of (start, end) offsets.
+    """
+    if _has_carriage_returns(path):
+        raise ValueError(f"{path} has \\r line endings, which only iter_job_blocks can read")
+    size = os.path.getsize(path)
+    if size == 0:
+        return [(0, size)]
+    
+    ranges = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start + range_bytes < size:
+            boundary = mm.find(b'\n\n', start + range_bytes)
+            if boundary == -1:
+                break
+            # The split pairs up a run of newlines from its first one (or from start)
+            while boundary > start and mm[boundary - 1] == 10:
+                boundary -= 1
+            ranges.append((start, boundary))
+            start = boundary + 2
+    ranges.append((start, size))
+    return ranges
+
+def z_array(text):
+    """Z-function: z[i] is the length of the longest common prefix of text and text[i:]"""
+    n = len(text)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and text[z[i]] == text[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+def fix_duplicated_title(position):
+    """Fix a duplicated position line in linear time
     
-    for block in job_blocks:
-        lines = block.strip().split('\n')
-        if len(lines) < 3:  # Need at least company, position, and location
+    LinkedIn dumps repeat the title: "TitleTitle", "Title Title" or with a suffix after
+    the copy, as in "TitleTitle with verification". The longest leading title that is
+    immediately repeated (optionally after whitespace) and whose copy ends the line or a
+    word is kept once, followed by whatever came after the copy. The two copies must make
+    up at least a third of the line, so "AA Engineer" is left alone.
+    """
+    n = len(position)
+    if n <= 10:
+        return position
+    
+    # Most lines are an exact "TitleTitle", which a slice comparison settles
+    half = n // 2
+    if n % 2 == 0 and position[:half] == position[half:]:
+        return position[:half]
+    
+    z = z_array(position)
+    
+    # next_word[i]: first non-whitespace index at or after i
+    next_word = list(range(n + 1))
+    for i in range(n - 1, -1, -1):
+        if position[i].isspace():
+            next_word[i] = next_word[i + 1]
+    
+    for length in range(n // 2, 0, -1):
+        start = next_word[length]
+        end = start + length
+        if end > n or z[start] < length:
             continue
-            
-        # Extract company (first line, remove "logo" suffix)
-        company_line = lines[0] if len(lines) > 0 else ""
-        company = company_line.replace(" logo", "").strip()
-        
-        # Extract position (second line, fix duplication)
-        position = lines[1] if len(lines) > 1 else ""
-        
-        # Fix duplicated position with improved algorithm
-        if position:
-            # More robust duplication detection
-            # Pattern 1: "TitleTitle" -> "Title"
-            if len(position) > 10:
-                # Try to find exact duplication
-                for i in range(1, len(position) // 2 + 1):
-                    if position[:i] == position[i:2*i]:
-                        # Check if this is a complete word boundary
-                        if i == len(position) // 2 or position[i-1] == ' ' or position[i] == ' ':
-                            position = position[:i]
-                            break
-                
-                # Additional regex patterns for common duplications
-                patterns = [
-                    (r'(.+?)\1', r'\1'),  # Any repeated text
-                    (r'(.+?)\s+\1', r'\1'),  # Repeated text with space
-                    (r'^(.+?)(?=\1)', r'\1'),  # Start of string duplication
-                ]
-                
-                for pattern, replacement in patterns:
-                    new_position = re.sub(pattern, replacement, position)
-                    if new_position != position:
-                        position = new_position
-                        break
-        
-        # Reconstruct the job block with fixed position
-        if len(lines) > 1:
-            lines[0] = company_line  # Keep original company line
-            lines[1] = position
-            fixed_block = '\n'.join(lines)
+        if end < n and not position[end].isspace():
+            continue
+        if 2 * length < n / 3:
+            continue
+        return position[:length] + position[end:]
+    
+    return position
+
+def fix_job_block(block):
+    """Fix the position line of one raw job block, or return None if it is not a job"""
+    lines = block.strip().split('\n')
+    if len(lines) < 3:  # Need at least company, position, and location
+        return None
+    
+    # Line 0 keeps the original company line, line 1 gets the fixed position
+    lines[1] = fix_duplicated_title(lines[1])
+    return '\n'.join(lines)
+
+def fix_duplicated_titles(input_path='remote-trainee-jobs.txt', output_path='fixed_remote-trainee-jobs.txt'):
+    """Fix duplicated titles in the raw job data"""
+    
+    print("🔧 Fixing duplicated titles in raw data...")
+    
+    fixed_jobs = []
+    for block in iter_input_blocks(input_path):
+        fixed_block = fix_job_block(block)
+        if fixed_block is not None:
             fixed_jobs.append(fixed_block)
     
     # Write fixed data back
-    with open('fixed_remote-trainee-jobs.txt', 'w', encoding='utf-8') as f:
+    with open(output_path, 'w', encoding='utf-8') as f:
         f.write('\n\n'.join(fixed_jobs))
     
     print(f"✅ Fixed {len(fixed_jobs)} job titles")
     return fixed_jobs
 
-def parse_fixed_jobs():
-    """Parse the fixed job data into structured format"""
+# Line classes of a job block in precedence order; salary terms match case-sensitively
+LINE_TERMS = {
+    'location': ['argentina', 'remote', 'latin america', 'buenos aires', 'córdoba', 'mendoza'],
+    'salary': ['$', '/yr', '/month', 'k/yr'],
+    'time': ['ago', 'hours', 'days', 'weeks', 'months', 'years'],
+    'tags': ['easy apply', 'actively reviewing', 'viewed', 'be an early applicant', 'you\'d be a top applicant']
+}
+
+class LineClassifier:
+    """Classify a line as one of several term classes through a flat term table
     
-    print("📊 Parsing fixed job data...")
+    Classes are given in precedence order and their terms are flattened into one table
+    in that order. Each term is checked as a substring of the lowercased line in table
+    order, and the first term found names the winning class. Terms of classes in
+    case_sensitive are confirmed on the original line.
+    """
     
-    with open('fixed_remote-trainee-jobs.txt', 'r', encoding='utf-8') as f:
-        content = f.read()
+    def __init__(self, terms, case_sensitive=('salary',)):
+        self.terms = {name: list(class_terms) for name, class_terms in terms.items()}
+        self.case_sensitive = set(case_sensitive)
+        self._compile()
     
-    job_blocks = content.split('\n\n')
+    def _compile(self):
+        self._table = tuple(term.lower() for class_terms in self.terms.values() for term in class_terms)
+        self._term_class = {}
+        self._exact_terms = {}
+        for name, class_terms in self.terms.items():
+            for term in class_terms:
+                self._term_class.setdefault(term.lower(), name)
+                if name in self.case_sensitive:
+                    self._exact_terms.setdefault(term.lower(), []).append(term)
     
-    jobs = []
+    def extend(self, name, new_terms):
+        """Add terms to a class, e.g. more location names"""
+        self.terms[name].extend(new_terms)
+        self._compile()
     
-    for block in job_blocks:
-        lines = block.strip().split('\n')
-        if len(lines) < 3:
-            continue
-        
-        # Extract job information based on the format:
-        # Line 0: Company + "logo"
-        # Line 1: Position (fixed duplication)
-        # Line 2: Company name (repeated)
-        # Line 3+: Location, salary, time, tags
-        
-        company_line = lines[0] if len(lines) > 0 else ""
-        company = company_line.replace(" logo", "").strip()
-        position = lines[1] if len(lines) > 1 else ""
-        company_repeated = lines[2] if len(lines) > 2 else ""
-        
-        # Extract location, salary, time, tags from remaining lines
-        location = ""
-        salary = ""
-        time_posted = ""
-        tags = []
-        
-        for line in lines[3:]:
-            line = line.strip()
-            if not line:
+    def classify(self, line):
+        """Name of the highest-precedence class with a term in line, or None"""
+        for term in filter(line.lower().__contains__, self._table):
+            name = self._term_class[term]
+            if name in self.case_sensitive and not any(exact in line for exact in self._exact_terms[term]):
                 continue
-                
-            # Location patterns
-            if any(loc in line.lower() for loc in ['argentina', 'remote', 'latin america', 'buenos aires', 'córdoba', 'mendoza']):
-                location = line
-            # Salary patterns
-            elif any(s in line for s in ['$', '/yr', '/month', 'k/yr']):
-                salary = line
-            # Time patterns
-            elif any(t in line.lower() for t in ['ago', 'hours', 'days', 'weeks', 'months', 'years']):
-                time_posted = line
-            # Tags patterns
-            elif any(t in line.lower() for t in ['easy apply', 'actively reviewing', 'viewed', 'be an early applicant', 'you\'d be a top applicant']):
-                tags.append(line)
-        
-        if position and company:
-            jobs.append({
-                'company': company,
-                'title': position,
-                'location': location,
-                'salary': salary,
-                'time_posted': time_posted,
-                'tags': '; '.join(tags)
-            })
+            return name
+        return None
+
+LINE_CLASSIFIER = LineClassifier(LINE_TERMS)
+
+def parse_job_block(block):
+    """Parse one fixed job block into a job dict, or return None if it is incomplete"""
+    lines = block.strip().split('\n')
+    if len(lines) < 3:
+        return None
+    
+    # Extract job information based on the format:
+    # Line 0: Company + "logo"
+    # Line 1: Position (fixed duplication)
+    # Line 2: Company name (repeated)
+    # Line 3+: Location, salary, time, tags
+    
+    company_line = lines[0] if len(lines) > 0 else ""
+    company = company_line.replace(" logo", "").strip()
+    position = lines[1] if len(lines) > 1 else ""
+    
+    # Extract location, salary, time, tags from remaining lines
+    location = ""
+    salary = ""
+    time_posted = ""
+    tags = []
+    
+    classify = LINE_CLASSIFIER.classify
+    for line in lines[3:]:
+        line = line.strip()
+        if not line:
+            continue
+            
+        # One pass decides location > salary > time > tags (see LINE_TERMS)
+        line_class = classify(line)
+        if line_class == 'location':
+            location = line
+        elif line_class == 'salary':
+            salary = line
+        elif line_class == 'time':
+            time_posted = line
+        elif line_class == 'tags':
+            tags.append(line)
+    
+    if not (position and company):
+        return None
+    
+    return {
+        'company': company,
+        'title': position,
+        'location': location,
+        'salary': salary,
+        'time_posted': time_posted,
+        'tags': '; '.join(tags)
+    }
+
+def parse_fixed_jobs(path='fixed_remote-trainee-jobs.txt'):
+    """Parse the fixed job data into a JobTable (see JobTable.to_frame for a DataFrame)"""
+    
+    print("📊 Parsing fixed job data...")
+    
+    jobs = JobTable()
+    for block in iter_job_blocks(path):
+        job = parse_job_block(block)
+        if job is not None:
+            jobs.append(job)
     
     return jobs
 
@@ -195,542 +465,2549 @@ def extract_days_ago(time_text):
     
     return None
 
-def create_accurate_categorizer():
-    """Create accurate categorization system"""
-    
-    categories = {
-        'Software Engineer': {
-            'primary': [
-                'software engineer', 'software developer', 'developer', 'programmer', 'coder',
-                'full stack', 'fullstack', 'frontend', 'front-end', 'backend', 'back-end',
-                'web developer', 'application developer', 'systems developer', 'mobile developer',
-                'ios engineer', 'android developer', 'react developer', 'angular developer',
-                'vue developer', 'node developer', 'python developer', 'java developer',
-                'php developer', 'ruby developer', 'go developer', 'rust developer',
-                'c++ developer', 'c# developer', '.net developer', 'django developer',
-                'flask developer', 'spring developer', 'express developer', 'laravel developer',
-                'rails developer', 'asp.net developer', 'html developer', 'css developer',
-                'javascript developer', 'typescript developer', 'jquery developer',
-                'desarrollador', 'desarrollador/a', 'linux kernel engineer', 'kernel engineer',
-                'ubuntu engineer', 'cryptography engineer', 'security engineer', 'silicon engineer',
-                'containerization engineer', 'virtualisation engineer', 'embedded engineer',
-                'field engineer', 'support engineer', 'system administration', 'build system',
-                'software traine', 'desarolador'
-            ],
-            'technologies': [
-                'react', 'angular', 'vue', 'node.js', 'nodejs', 'python', 'java', 'javascript', 
-                'typescript', 'php', 'ruby', 'go', 'golang', 'rust', 'c++', 'c#', '.net', 
-                'django', 'flask', 'spring', 'express', 'laravel', 'rails', 'asp.net', 
-                'html', 'css', 'sass', 'scss', 'bootstrap', 'tailwind', 'jquery', 'linux',
-                'ubuntu', 'kernel', 'docker', 'kubernetes', 'revit', 'structural'
-            ],
-            'exclusions': [
-                'kinesiólogo', 'kinesiologo', 'attorney', 'lawyer', 'accountant', 'recruiter',
-                'assistant', 'coordinator', 'manager', 'specialist', 'analyst', 'trader',
-                'setter', 'generation', 'marketing', 'sales', 'hr', 'human resources',
-                'translator', 'paralegal', 'litigation', 'immigration', 'law', 'legal',
-                'data scientist', 'machine learning', 'ai engineer', 'computer vision',
-                'research', 'clinical', 'curricular', 'annotator', 'teacher', 'instructor',
-                'founder', 'partnerships', 'consultor', 'consultoría', 'cost estimator'
-            ],
-            'patterns': [
-                r'\b(software|web|mobile|full.?stack|front.?end|back.?end)\s+(developer|engineer|programmer)\b',
-                r'\b(react|angular|vue|node|python|java|javascript|typescript|php|ruby|go|rust|c\+\+|c#|\.net)\s+(developer|engineer)\b',
-                r'\b(developer|engineer|programmer)\b.*\b(react|angular|vue|node|python|java|javascript|typescript|php|ruby|go|rust|c\+\+|c#|\.net)\b',
-                r'\b(linux|ubuntu|kernel|cryptography|security|silicon|containerization|virtualisation|embedded|field|support)\s+(engineer)\b',
-                r'\b(system\s+administration|build\s+system)\b'
-            ]
-        },
-        'AI/ML Engineer': {
-            'primary': [
-                'ai engineer', 'artificial intelligence engineer', 'machine learning engineer', 'ml engineer',
-                'ai agent', 'ai assistant', 'computer vision engineer', 'vision engineer',
-                'applied ai engineer', 'ai data labeler', 'data labeler', 'ai training',
-                'founding data engineer', 'machine learning', 'deep learning', 'neural networks',
-                'ai/ml', 'ai agent assistant', 'ai video creator', 'ai content creator'
-            ],
-            'technologies': [
-                'tensorflow', 'pytorch', 'scikit-learn', 'scikit learn', 'keras', 'opencv',
-                'computer vision', 'neural networks', 'deep learning', 'machine learning',
-                'ai', 'artificial intelligence', 'ml', 'data labeling', 'annotation'
-            ],
-            'exclusions': [
-                'data scientist', 'data analyst', 'research', 'clinical', 'curricular',
-                'teacher', 'instructor', 'founder', 'partnerships', 'consultor', 'consultoría'
-            ],
-            'patterns': [
-                r'\b(ai|artificial\s+intelligence|machine\s+learning|ml|computer\s+vision|vision)\s+(engineer|assistant|agent|creator)\b',
-                r'\b(applied\s+ai|ai\s+agent|ai\s+assistant|ai\s+data\s+labeler|data\s+labeler)\b',
-                r'\b(computer\s+vision|vision\s+engineer|ai\s+training|ai\s+video\s+creator)\b'
-            ]
-        },
-        'Data Science': {
-            'primary': [
-                'data scientist', 'data analyst', 'machine learning engineer', 'ml engineer',
-                'ai engineer', 'artificial intelligence engineer', 'statistician', 'bi analyst',
-                'business intelligence analyst', 'analytics engineer', 'data engineer',
-                'research scientist', 'quantitative analyst', 'quants', 'data science',
-                'machine learning', 'deep learning', 'artificial intelligence', 'ai/ml'
-            ],
-            'technologies': [
-                'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'scikit learn',
-                'jupyter', 'spark', 'hadoop', 'tableau', 'power bi', 'powerbi', 'matplotlib',
-                'seaborn', 'plotly', 'r', 'sas', 'spss', 'stata', 'excel', 'sql', 'nosql'
-            ],
-            'exclusions': [
-                'attorney', 'lawyer', 'accountant', 'recruiter', 'assistant', 'coordinator',
-                'manager', 'specialist', 'trader', 'setter', 'generation', 'marketing',
-                'sales', 'hr', 'human resources', 'kinesiólogo', 'kinesiologo', 'vendedor',
-                'asesor', 'redactor', 'publicitario', 'creativo', 'translator', 'paralegal',
-                'litigation', 'immigration', 'law', 'legal', 'german', 'spanish', 'french',
-                'interpreter', 'translation', 'language', 'linguist', 'freelance', 'frelance',
-                'freelancer', 'frelancer', 'virtual', 'remote', 'online', 'digital', 'web',
-                'frontend', 'front-end', 'backend', 'back-end', 'full stack', 'fullstack',
-                'developer', 'programmer', 'coder', 'software', 'web developer', 'mobile',
-                'react', 'angular', 'vue', 'node', 'javascript', 'typescript', 'python',
-                'java', 'php', 'ruby', 'go', 'rust', 'c++', 'c#', '.net', 'django', 'flask',
-                'spring', 'express', 'laravel', 'rails', 'asp.net', 'html', 'css', 'sass',
-                'scss', 'bootstrap', 'tailwind', 'jquery', 'designer', 'design', 'ui', 'ux',
-                'graphic', 'visual', 'creative', 'brand', 'logo', 'product', 'content',
-                'writer', 'editor', 'creator', 'copy', 'blog', 'article', 'copywriter',
-                'video', 'media', 'production', 'filming', 'editing', 'motion', 'cinematographer',
-                'customer', 'client', 'technical', 'help', 'support', 'success', 'care',
-                'administrative', 'executive', 'personal', 'virtual assistant', 'office',
-                'admin', 'hr', 'human resources', 'recruiter', 'talent', 'acquisition',
-                'hiring', 'sourcer', 'marketing', 'seo', 'sem', 'ppc', 'social', 'email',
-                'digital', 'brand', 'growth', 'ads', 'google ads', 'facebook ads',
-                'instagram ads', 'linkedin ads', 'twitter ads', 'sales', 'business development',
-                'account', 'executive', 'representative', 'bdr', 'sdr', 'lead generation',
-                'appointment setter', 'qa', 'quality assurance', 'testing', 'tester',
-                'test engineer', 'devops', 'sre', 'platform', 'infrastructure', 'cloud',
-                'site reliability', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-                'consultor', 'consultoría', 'funcional', 'ecommerce', 'ecomerce', 'analista',
-                'especialista', 'productor', 'asesor', 'comercial', 'telefónico', 'educación',
-                'sap', 'reporting', 'salesforce', 'aml', 'cft', 'manuales', 'conciliaciones',
-                'bancarias', 'excel', 'erp', 'business', 'process', 'management', 'consulting',
-                'sustainability', 'responsible', 'consultant', 'health', 'industry', 'public',
-                'service', 'infrastructure', 'dba', 'informix', 'consultores', 'fi',
-                'founder', 'residence', 'trainee', 'intern', 'graduate', 'quantitative',
-                'bookkeeper', 'financial', 'accounting', 'treasury', 'bookkeeping',
-                'ai agent', 'computer vision', 'applied ai', 'data labeler', 'research',
-                'clinical', 'curricular', 'annotator', 'teacher', 'instructor', 'partnerships'
-            ],
-            'patterns': [
-                r'\b(data\s+scientist|data\s+analyst|machine\s+learning\s+engineer|ml\s+engineer)\b',
-                r'\b(ai\s+engineer|artificial\s+intelligence\s+engineer|statistician)\b',
-                r'\b(bi\s+analyst|business\s+intelligence\s+analyst|analytics\s+engineer)\b',
-                r'\b(data\s+engineer|research\s+scientist|quantitative\s+analyst)\b',
-                r'\b(pandas|numpy|tensorflow|pytorch|scikit|jupyter|spark|hadoop|tableau|power\s+bi)\b'
-            ]
-        },
-        'Research & Education': {
-            'primary': [
-                'market research', 'research assistant', 'research associate', 'clinical research',
-                'curricular data annotator', 'data annotator', 'annotator', 'esl teacher',
-                'teacher', 'instructor', 'data science instructor', 'peer reviewer',
-                'research scientist', 'academic', 'educational', 'teaching', 'tutoring',
-                'behavioral health coach', 'health coach', 'coach'
-            ],
-            'patterns': [
-                r'\b(market\s+research|research\s+assistant|research\s+associate|clinical\s+research)\b',
-                r'\b(curricular\s+data\s+annotator|data\s+annotator|annotator)\b',
-                r'\b(esl\s+teacher|teacher|instructor|data\s+science\s+instructor)\b',
-                r'\b(peer\s+reviewer|behavioral\s+health\s+coach|health\s+coach|coach)\b'
-            ]
-        },
-        'Consulting & Business': {
-            'primary': [
-                'consultor', 'consultoría', 'consultant', 'consulting', 'partnerships associate',
-                'partnerships', 'founder in residence', 'founder', 'residence', 'business analyst',
-                'functional analyst', 'analista funcional', 'consultores', 'consultores sap',
-                'sap consultant', 'sap fi', 'aml', 'cft', 'manuales', 'reporting', 'salesforce',
-                'qanalyst', 'qa analyst', 'cost estimator', 'estimator', 'inspections associate'
-            ],
-            'patterns': [
-                r'\b(consultor|consultoría|consultant|consulting|partnerships|founder)\b',
-                r'\b(analista\s+funcional|functional\s+analyst|business\s+analyst)\b',
-                r'\b(consultores|sap|aml|cft|manuales|reporting|salesforce)\b',
-                r'\b(qanalyst|qa\s+analyst|cost\s+estimator|estimator|inspections)\b'
-            ]
-        },
-        'Specialized Technical': {
-            'primary': [
-                'structural modeler', 'modeler', 'revit', 'metal building detailer', 'detailer',
-                'joinery', 'furniture', 'cost estimator', 'estimator', 'performance benchmarking',
-                'benchmarking engineer', 'risc-v', 'workloads', 'vector illustrator', 'illustrator',
-                'animator', 'graphics', 'visual design', 'dtp specialist', 'desktop publishing',
-                'conciliaciones bancarias', 'bancarias', 'excel specialist', 'financial specialist'
-            ],
-            'patterns': [
-                r'\b(structural\s+modeler|modeler|revit|metal\s+building\s+detailer|detailer)\b',
-                r'\b(joinery|furniture|cost\s+estimator|estimator|performance\s+benchmarking)\b',
-                r'\b(benchmarking\s+engineer|risc-v|workloads|vector\s+illustrator|illustrator)\b',
-                r'\b(animator|graphics|visual\s+design|dtp\s+specialist|desktop\s+publishing)\b',
-                r'\b(conciliaciones\s+bancarias|bancarias|excel\s+specialist|financial\s+specialist)\b'
-            ]
-        },
-        'Legal': {
-            'primary': [
-                'attorney', 'lawyer', 'paralegal', 'legal assistant', 'legal specialist',
-                'litigation', 'immigration', 'law specialist', 'legal analyst', 'legal coordinator',
-                'legal manager', 'legal consultant', 'legal advisor', 'legal researcher',
-                'legal writer', 'legal editor', 'legal translator', 'legal interpreter'
-            ],
-            'patterns': [
-                r'\b(attorney|lawyer|paralegal|legal|litigation|immigration|law)\b',
-                r'\b(german|spanish|french|english)\s+(translator|interpreter|specialist)\b'
-            ]
-        },
-        'Translation': {
-            'primary': [
-                'translator', 'interpreter', 'translation specialist', 'language specialist',
-                'german translator', 'spanish translator', 'french translator', 'english translator',
-                'bilingual specialist', 'language coordinator', 'translation coordinator',
-                'welsh', 'linguistic', 'latin script', 'guarani', 'sicilian'
-            ],
-            'patterns': [
-                r'\b(translator|interpreter|translation|language|bilingual)\b',
-                r'\b(german|spanish|french|english|portuguese|italian|welsh|guarani|sicilian)\s+(translator|interpreter)\b',
-                r'\b(linguistic|latin\s+script)\b'
-            ]
-        },
-        'Marketing': {
-            'primary': [
-                'marketing specialist', 'digital marketing specialist', 'seo specialist',
-                'sem specialist', 'ppc specialist', 'social media specialist', 'content marketing',
-                'email marketing', 'growth marketing', 'brand marketing', 'marketing analyst',
-                'marketing coordinator', 'marketing manager', 'ads specialist', 'media buyer',
-                'seo', 'sem', 'ppc', 'google ads', 'facebook ads', 'instagram ads',
-                'marketing asistant'
-            ],
-            'patterns': [
-                r'\b(marketing|seo|sem|ppc|content|social|email|digital|brand|growth|ads|media)\b',
-                r'\b(google.?ads|facebook.?ads|instagram.?ads|linkedin.?ads|twitter.?ads)\b'
-            ]
-        },
-        'Sales': {
-            'primary': [
-                'sales representative', 'sales specialist', 'account executive', 'business development',
-                'sales development representative', 'sdr', 'business development representative',
-                'bdr', 'sales manager', 'account manager', 'sales coordinator', 'lead generation',
-                'sales consultant', 'sales analyst', 'appointment setter', 'apointment seter', 'vendedor', 'prospeción',
-                'prospección', 'ventas', 'comercial', 'salesperson', 'cold caller', 'caller', 'cold caler'
-            ],
-            'patterns': [
-                r'\b(sales|business.?development|account|executive|representative|bdr|sdr|lead.?generation|vendedor|prospeción|prospección|ventas|comercial|salesperson|cold.?caller|caller|cold.?caler)\b',
-                r'\b(apointment\s+seter|appointment\s+setter)\b'
-            ]
-        },
-        'Administrative': {
-            'primary': [
-                'administrative assistant', 'executive assistant', 'personal assistant',
-                'virtual assistant', 'office coordinator', 'administrative coordinator',
-                'office manager', 'administrative manager', 'assistant', 'coordinator',
-                'medical records specialist', 'records specialist', 'liability specialist',
-                'third-party liability', 'medical records', 'records management',
-                'administrative specialist', 'office specialist', 'administrative analyst',
-                'office analyst', 'administrative coordinator', 'office coordinator',
-                'virtual asistant', 'executive asistant'
-            ],
-            'patterns': [
-                r'\b(assistant|coordinator|manager|admin|executive|virtual|office|administrative|asistant)\b',
-                r'\b(medical\s+records|records\s+specialist|liability\s+specialist|third.?party\s+liability)\b'
-            ]
-        },
-        'Human Resources': {
-            'primary': [
-                'hr specialist', 'human resources specialist', 'recruiter', 'talent acquisition',
-                'hr coordinator', 'hr manager', 'recruitment specialist', 'talent sourcer',
-                'hr assistant', 'people operations', 'hr analyst', 'aba recruiter'
-            ],
-            'patterns': [
-                r'\b(hr|human.?resources|recruiter|talent|acquisition|hiring|sourcer|aba\s+recruiter)\b'
-            ]
-        },
-        'Design': {
-            'primary': [
-                'ui designer', 'ux designer', 'graphic designer', 'visual designer',
-                'product designer', 'web designer', 'brand designer', 'creative designer',
-                'interaction designer', 'user experience designer', 'user interface designer',
-                'creative strategist'
-            ],
-            'patterns': [
-                r'\b(design|ui|ux|graphic|visual|creative|brand|logo|product.?design|strategist)\b'
-            ]
-        },
-        'Content Creation': {
-            'primary': [
-                'content creator', 'content writer', 'copywriter', 'blog writer', 'article writer',
-                'content specialist', 'content manager', 'editor', 'content editor', 'writer'
-            ],
-            'patterns': [
-                r'\b(content|writer|editor|creator|copy|blog|article|copywriter)\b'
-            ]
-        },
-        'Video/Media': {
-            'primary': [
-                'video editor', 'video producer', 'video creator', 'cinematographer',
-                'video specialist', 'media producer', 'video coordinator', 'editor',
-                'ai cinematographer'
-            ],
-            'patterns': [
-                r'\b(video|editor|media|production|filming|editing|motion|cinematographer|ai\s+cinematographer)\b'
-            ]
-        },
-        'DevOps': {
-            'primary': [
-                'devops engineer', 'site reliability engineer', 'sre', 'platform engineer',
-                'infrastructure engineer', 'cloud engineer', 'systems engineer', 'reliability engineer',
-                'automation engineer', 'ci/cd engineer', 'deployment engineer'
-            ],
-            'patterns': [
-                r'\b(devops|sre|platform|infrastructure|cloud|site.?reliability)\s+(engineer|specialist)\b'
-            ]
-        },
-        'QA/Testing': {
-            'primary': [
-                'qa engineer', 'quality assurance engineer', 'test engineer', 'software tester',
-                'automation tester', 'manual tester', 'test analyst', 'quality analyst',
-                'testing engineer', 'qa specialist', 'test specialist'
-            ],
-            'patterns': [
-                r'\b(qa|quality.?assurance|testing|tester|test.?engineer)\b'
-            ]
-        },
-        'Customer Support': {
-            'primary': [
-                'customer support', 'customer service', 'technical support', 'help desk',
-                'support specialist', 'customer success', 'client support', 'support engineer',
-                'customer care', 'support analyst'
-            ],
-            'patterns': [
-                r'\b(customer|client|technical|help|support|success|care)\b'
-            ]
-        },
-        'Finance/Accounting': {
-            'primary': [
-                'accountant', 'bookkeeper', 'financial analyst', 'finance analyst',
-                'accounting specialist', 'financial specialist', 'treasury analyst',
-                'accounting clerk', 'financial clerk', 'bookkeeping specialist',
-                'accounting assistant', 'financial assistant', 'accounting coordinator',
-                'financial coordinator', 'accounting manager', 'financial manager',
-                'accounting consultant', 'financial consultant', 'accounting advisor',
-                'financial advisor', 'accounting supervisor', 'financial supervisor',
-                'accounting director', 'financial director', 'accounting controller',
-                'financial controller', 'accounting officer', 'financial officer',
-                'accounting executive', 'financial executive', 'accounting administrator',
-                'financial administrator', 'quickbooks', 'acountant', 'balancero',
-                'cobranzas asociate'
-            ],
-            'patterns': [
-                r'\b(accountant|bookkeeper|financial|accounting|treasury|bookkeeping|quickbooks|acountant|balancero|cobranzas)\b'
-            ]
-        },
-        'Healthcare/Medical': {
-            'primary': [
-                'kinesiólogo', 'kinesiologo', 'physiotherapist', 'physical therapist',
-                'medical assistant', 'healthcare assistant', 'medical specialist',
-                'healthcare specialist', 'medical analyst', 'healthcare analyst',
-                'medical coordinator', 'healthcare coordinator', 'medical manager',
-                'healthcare manager', 'medical consultant', 'healthcare consultant',
-                'medical advisor', 'healthcare advisor', 'medical supervisor',
-                'healthcare supervisor', 'medical director', 'healthcare director',
-                'medical officer', 'healthcare officer', 'medical executive',
-                'healthcare executive', 'medical administrator', 'healthcare administrator'
-            ],
-            'exclusions': [
-                'medical records', 'records specialist', 'liability specialist',
-                'third-party liability', 'records management', 'administrative',
-                'office', 'coordinator', 'assistant', 'manager', 'specialist'
-            ],
-            'patterns': [
-                r'\b(kinesiólogo|kinesiologo|physiotherapist|physical\s+therapist|medical|healthcare)\b'
-            ]
-        },
-        'Trading/Finance': {
-            'primary': [
-                'quantitative trader', 'trader', 'trading analyst', 'trading specialist',
-                'trading coordinator', 'trading manager', 'trading consultant',
-                'trading advisor', 'trading supervisor', 'trading director',
-                'trading officer', 'trading executive', 'trading administrator'
-            ],
-            'patterns': [
-                r'\b(quantitative\s+trader|trader|trading)\b'
-            ]
-        }
-    }
+# Column-level versions of the two extractors above, for a whole batch of jobs at once
+SALARY_NUMBER_PATTERN = r'\$?([\d,]+(?:\.\d+)?)'
+POSTED_AGE_PATTERN = r'(\d+(?:\.\d+)?)\s*(hour|day|week|month|year)'
+POSTED_AGE_UNITS = ['hour', 'day', 'week', 'month', 'year']
+# Days per unit as multiplier / divisor, so hours divide by 24 exactly like extract_days_ago
+POSTED_AGE_MULTIPLIERS = [1.0, 1.0, 7.0, 30.0, 365.0]
+POSTED_AGE_DIVISORS = [24.0, 1.0, 1.0, 1.0, 1.0]
+
+def _factorize(texts):
+    """Distinct texts and each row's code into them (-1 for None)
     
-    def categorize_job(title, description=None):
-        """Categorize a job with very precise matching and exclusions"""
-        if not title:
-            return ('Other', 0.0, [])
+    A dump repeats the same salary and posting-age strings over and over, so extraction
+    only runs once per distinct string and is broadcast back with the codes.
+    """
+    import pandas as pd
+    codes, uniques = pd.factorize(pd.Series(list(texts), dtype=object))
+    return codes, pd.Series(uniques, dtype=object)
+
+def _broadcast(values, codes):
+    """Spread per-distinct values back to rows; code -1 picks the trailing NaN"""
+    import numpy as np
+    return np.append(values, np.nan)[codes]
+
+def _to_floats(strings):
+    """float() every matched number, which also accepts any Unicode digits \\d matched"""
+    import numpy as np
+    return np.asarray(strings, dtype=object).astype(np.float64)
+
+def extract_salary_ranges(salary_texts):
+    """Vectorized extract_salary_range: (salary_min, salary_max) arrays, NaN when missing
+    
+    Every number is pulled out with one str.extractall; monthly salaries are scaled by a
+    per-row multiplier of 12 and anything else (yearly or no unit) is kept as annual.
+    A single number gives the same min and max.
+    """
+    import numpy as np
+    codes, texts = _factorize(salary_texts)
+    salary_min = np.full(len(texts), np.nan)
+    salary_max = np.full(len(texts), np.nan)
+    texts = texts[texts != '']
+    numbers = texts.str.extractall(SALARY_NUMBER_PATTERN)[0].str.replace(',', '', regex=False)
+    numbers = numbers[numbers != '']  # a lone run of commas is not a number
+    if not numbers.empty:
+        lower = texts.str.lower()
+        is_monthly = lower.str.contains('/month', regex=False) | lower.str.contains('monthly', regex=False)
+        multiplier = np.ones(len(salary_min))
+        multiplier[texts.index.to_numpy()] = np.where(is_monthly.to_numpy(dtype=bool), 12.0, 1.0)
         
-        # Clean the title
-        title_lower = title.lower()
-        title_lower = re.sub(r'[^\w\s]', ' ', title_lower)
-        title_lower = re.sub(r'\s+', ' ', title_lower).strip()
+        rows = numbers.index.get_level_values(0).to_numpy()
+        values = _to_floats(numbers.to_numpy()) * multiplier[rows]
         
+        # Matches are grouped by row, so reduce each contiguous run of values
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        salary_min[rows[starts]] = np.minimum.reduceat(values, starts)
+        salary_max[rows[starts]] = np.maximum.reduceat(values, starts)
+    return _broadcast(salary_min, codes), _broadcast(salary_max, codes)
+
+def extract_days_ago_many(time_texts):
+    """Vectorized extract_days_ago: an array of posting ages in days, NaN when missing"""
+    import numpy as np
+    codes, texts = _factorize(time_texts)
+    days_ago = np.full(len(texts), np.nan)
+    match = texts.str.lower().str.extract(POSTED_AGE_PATTERN).dropna()
+    if not match.empty:
+        units = match[1].map(POSTED_AGE_UNITS.index).to_numpy(dtype=np.intp)
+        numbers = _to_floats(match[0].to_numpy())
+        days_ago[match.index.to_numpy()] = (numbers * np.array(POSTED_AGE_MULTIPLIERS)[units]
+                                            / np.array(POSTED_AGE_DIVISORS)[units])
+    return _broadcast(days_ago, codes)
+
+def normalize_title(title):
+    """Lowercase a title and collapse punctuation and whitespace into single spaces"""
+    title_lower = NON_WORD_RE.sub(' ', title.lower())
+    return WHITESPACE_RE.sub(' ', title_lower).strip()
+
+def pattern_literals(pattern):
+    """Return lowercase literals one of which every match of pattern must contain.
+    
+    Returns None when no such set can be derived, in which case the pattern has to be
+    searched on every title.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+    literals = _sequence_literals(list(parsed))
+    if not literals:
+        return None
+    for literal in literals:
+        # Non-ASCII characters that IGNORECASE folds onto ASCII letters (ſ, K, ı, İ)
+        # would let the regex match text the literal check rejects
+        for char in literal:
+            if not char.isascii() and any(re.fullmatch(re.escape(char), letter, re.IGNORECASE)
+                                          for letter in string.ascii_letters):
+                return None
+    return {literal.lower() for literal in literals}
 
+def _sequence_literals(items):
+    """Pick the most selective required literal set from a parsed regex sequence"""
+    best = None
+    
+    def consider(candidate):
+        nonlocal best
+        if not candidate or '' in candidate:
+            return
+        if best is None or min(map(len, candidate)) > min(map(len, best)):
+            best = candidate
+    
+    run = []
+    for op, av in items + [(None, None)]:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            consider({''.join(run)})
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            consider(_sequence_literals(list(av[-1])))
+        elif op is sre_parse.BRANCH:
+            branches = [_sequence_literals(list(branch)) for branch in av[1]]
+            if all(branches):
+                consider(set().union(*branches))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            consider(_sequence_literals(list(av[2])))
+    return best
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton that finds every keyword contained in a text in one pass"""
+    
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
         
-        # Score each category
-        category_scores = defaultdict(float)
-        category_matches = defaultdict(list)
+        # Build the keyword trie
+        goto = [{}]
+        outputs = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
         
-        for category, data in categories.items():
-            score = 0.0
-            matches = []
-            
-            # Check exclusions first - if any exclusion word is found, skip this category
-            exclusions = data.get('exclusions', [])
-            for exclusion in exclusions:
-                if exclusion in title_lower:
-                    score = -1000  # Heavy penalty for exclusions
-                    break
-            
-            if score < 0:  # Skip this category due to exclusions
-                continue
+        # Resolve failure links breadth-first and fold them into a full transition table,
+        # so matching never has to walk failure chains
+        fail = [0] * len(goto)
+        transitions = [None] * len(goto)
+        transitions[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = dict(transitions[fail[state]])
+            transitions[state].update(goto[state])
+            outputs[state].extend(outputs[fail[state]])
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0)
+                queue.append(next_state)
+        
+        self._transitions = transitions
+        self._outputs = [tuple(output) for output in outputs]
+    
+    def find(self, text):
+        """Return the set of keyword indexes occurring anywhere in text"""
+        transitions = self._transitions
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+def typo_distance_limit(length):
+    """Largest edit distance a title word of this length may be corrected across"""
+    for max_length, distance in TYPO_DISTANCE_BY_LENGTH:
+        if length <= max_length:
+            return distance
+    return TYPO_MAX_DISTANCE
+
+def word_deletes(word, distance):
+    """Every string obtained by deleting up to distance characters from word, word included"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+def same_stem(word, other):
+    """Whether two words only differ in their endings: one extends the other, or both
+    end in INFLECTION_ENDINGS after a shared stem"""
+    if word.startswith(other) or other.startswith(word):
+        return True
+    stem = len(os.path.commonprefix([word, other]))
+    return any(word[i:] in INFLECTION_ENDINGS and other[i:] in INFLECTION_ENDINGS
+               for i in range(max(0, stem - 3), stem + 1))
+
+def osa_distance(a, b, limit):
+    """Optimal string alignment distance (edits plus adjacent transpositions), or limit + 1 past limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+class TypoIndex:
+    """SymSpell-style deletion dictionary correcting misspelled title words to rule words
+    
+    Every rule word is indexed under all its deletions of up to TYPO_MAX_DISTANCE
+    characters. A title word is looked up through its own deletions, so the cost of a
+    lookup depends on the word length only, never on the number of rules. A word is only
+    corrected when a single rule word with the same first letter is closest and is not
+    another form of the same stem (see same_stem); rule words, TYPO_KNOWN_WORDS and short
+    words are kept.
+    """
+    
+    def __init__(self, words, max_corrections=100000):
+        self.words = frozenset(words)
+        self.max_corrections = max_corrections
+        self._deletes = {}
+        for word in sorted(self.words):
+            for variant in word_deletes(word, TYPO_MAX_DISTANCE):
+                self._deletes.setdefault(variant, []).append(word)
+        self._corrections = {}
+    
+    def lookup(self, word):
+        """The rule word a title word is a typo of, or the word itself"""
+        correction = self._corrections.get(word)
+        if correction is not None:
+            return correction
+        
+        correction = word
+        limit = typo_distance_limit(len(word))
+        if (limit and word not in self.words and word not in TYPO_KNOWN_WORDS
+                and len(word) <= TYPO_MAX_WORD_LENGTH and word.isalpha()):
+            candidates = set()
+            for variant in word_deletes(word, limit):
+                candidates.update(self._deletes.get(variant, ()))
+            best_distance = limit + 1
+            best = []
+            for candidate in candidates:
+                if candidate[0] != word[0]:
+                    continue
+                distance = osa_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                if distance < best_distance:
+                    best_distance, best = distance, [candidate]
+                elif distance == best_distance:
+                    best.append(candidate)
+            # A closest rule word of the same stem means the word is just another form of it
+            if len(best) == 1 and not same_stem(word, best[0]):
+                correction = best[0]
+        
+        if len(self._corrections) >= self.max_corrections:
+            self._corrections.clear()
+        self._corrections[word] = correction
+        return correction
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_corrections'] = {}
+        return state
+    
+    def correct(self, title_lower):
+        """Replace every misspelled word of a normalized title with the rule word it means"""
+        lookup = self.lookup
+        return ' '.join([lookup(word) for word in title_lower.split()])
+
+def rules_fingerprint(categories, typo_tolerance=False):
+    """Stable hash of the rule tables, used to tell when cached results are stale"""
+    payload = json.dumps(categories, ensure_ascii=False) + f"\nresults:{RESULT_ENCODING}"
+    if typo_tolerance:
+        payload += f"\ntypo:{TYPO_SETTINGS}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class CategorizationCache:
+    """Bounded LRU cache of categorization results keyed on the normalized title
+    
+    Entries belong to the fingerprint of the rule tables they were computed with; a
+    lookup under a different fingerprint drops every entry first.
+    """
+    
+    def __init__(self, maxsize=50000):
+        self.maxsize = maxsize
+        self.fingerprint = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+    
+    def get(self, fingerprint, title_lower):
+        """Return the cached (category, confidence, rule ids) result, or None on a miss"""
+        if fingerprint != self.fingerprint:
+            if self.fingerprint is not None:
+                self.invalidations += 1
+            self._entries.clear()
+            self.fingerprint = fingerprint
+        
+        result = self._entries.get(title_lower)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(title_lower)
+        self.hits += 1
+        return result
+    
+    def put(self, fingerprint, title_lower, result):
+        """Store a result, evicting the least recently used entry when full"""
+        if self.maxsize <= 0 or fingerprint != self.fingerprint:
+            return
+        self._entries[title_lower] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def info(self):
+        """Hit, miss, eviction and invalidation counters plus the current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+def rule_identities(rules):
+    """(category, kind, label, occurrence) of every rule id, which survive rule edits"""
+    seen = Counter()
+    identities = []
+    for rule, category in enumerate(rules.rule_category):
+        key = (rules.category_names[category], rules.rule_kind[rule], rules.rule_label[rule])
+        identities.append(key + (seen[key],))
+        seen[key] += 1
+    return identities
+
+def rule_key(identity):
+    """Stable id of a rule in matched_keywords: 8 hex digits hashing its rule_identities
+    entry, so it keeps its meaning when other rules are added, removed or moved"""
+    return hashlib.blake2b(json.dumps(identity, ensure_ascii=False).encode('utf-8'), digest_size=4).hexdigest()
+
+class CategoryRules:
+    """Category rule tables compiled into a keyword automaton, a token index and regexes
+    
+    Every way a title can score is a numbered rule: a primary or technology substring,
+    a regex pattern or a title word. Rule numbers follow the table order, so the matches
+    of a category come out in the same order the rule tables list them. Outputs name a
+    rule by its rule_key instead, which does not change when other rules are edited.
+    With typo_tolerance, title words are first corrected to the words of the keywords
+    and exclusions.
+    """
+    
+    def __init__(self, categories, typo_tolerance=True):
+        self.categories = categories
+        self.category_names = list(categories)
+        self.typo_tolerance = typo_tolerance
+        self.fingerprint = rules_fingerprint(categories, typo_tolerance)
+        self.rule_category = []   # rule id -> category index
+        self.rule_weight = []     # rule id -> score added on a hit
+        self.rule_label = []      # rule id -> text recorded in the matches
+        self.rule_repeat = []     # rule id -> how many times the label is recorded
+        self.rule_kind = []       # rule id -> 'primary', 'technology', 'pattern' or 'token'
+        
+        keyword_ids = {}
+        keyword_rules = []      # keyword id -> substring rules firing when it is present
+        excluded_by = []        # keyword id -> categories the keyword excludes
+        pattern_triggers = []   # keyword id -> pattern rules that need it to be present
+        
+        def keyword_id(keyword):
+            if keyword not in keyword_ids:
+                keyword_ids[keyword] = len(keyword_ids)
+                keyword_rules.append([])
+                excluded_by.append(set())
+                pattern_triggers.append([])
+            return keyword_ids[keyword]
+        
+        def add_rule(category, kind, weight, label, repeat=1):
+            self.rule_category.append(category)
+            self.rule_kind.append(kind)
+            self.rule_weight.append(weight)
+            self.rule_label.append(label)
+            self.rule_repeat.append(repeat)
+            return len(self.rule_category) - 1
+        
+        self._patterns = []     # (category, regex, rule id) in table order
+        self._unfiltered_patterns = set()
+        self._token_rules = {}  # title word -> word rules
+        for index, (category, data) in enumerate(categories.items()):
+            is_data_science = category == 'Data Science'
+            primary = data.get('primary', [])
+            technologies = data.get('technologies', [])
             
-            # Check primary keywords (highest weight)
-            for keyword in data.get('primary', []):
-                if keyword in title_lower:
-                    # For Data Science, require more specific matches
-                    if category == 'Data Science':
-                        # Only count if it's a very specific data science term
-                        if any(term in keyword for term in ['data scientist', 'data analyst', 'machine learning', 'ml engineer', 'ai engineer', 'statistician', 'bi analyst', 'analytics engineer', 'data engineer', 'research scientist', 'quantitative analyst']):
-                            score += 25.0
-                            matches.append(keyword)
-                        else:
-                            score += 5.0  # Lower score for general terms
-                            matches.append(keyword)
-                    else:
-                        score += 20.0
-                        matches.append(keyword)
+            for exclusion in data.get('exclusions', []):
+                excluded_by[keyword_id(exclusion)].add(index)
             
-            # Check technology keywords (medium weight)
-            for keyword in data.get('technologies', []):
-                if keyword in title_lower:
-                    # For Data Science, only count specific data science technologies
-                    if category == 'Data Science':
-                        if any(tech in keyword for tech in ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit', 'jupyter', 'spark', 'hadoop', 'tableau', 'power bi', 'matplotlib', 'seaborn', 'plotly', 'r', 'sas', 'spss', 'stata']):
-                            score += 15.0
-                            matches.append(keyword)
-                        else:
-                            score += 2.0  # Very low score for general tech terms
-                            matches.append(keyword)
-                    else:
-                        score += 10.0
-                        matches.append(keyword)
+            # Substring matches on the whole title
+            for keyword in primary:
+                if is_data_science:
+                    weight = 25.0 if any(term in keyword for term in DATA_SCIENCE_PRIMARY_TERMS) else 5.0
+                else:
+                    weight = 20.0
+                keyword_rules[keyword_id(keyword)].append(add_rule(index, 'primary', weight, keyword))
+            for keyword in technologies:
+                if is_data_science:
+                    weight = 15.0 if any(tech in keyword for tech in DATA_SCIENCE_TECH_TERMS) else 2.0
+                else:
+                    weight = 10.0
+                keyword_rules[keyword_id(keyword)].append(add_rule(index, 'technology', weight, keyword))
             
-            # Check patterns (highest weight for exact matches)
+            # Patterns are only searched when the automaton saw one of their required literals
             for pattern in data.get('patterns', []):
-                if re.search(pattern, title_lower, re.IGNORECASE):
-                    score += 30.0
-                    matches.append(f"pattern_{pattern}")
+                rule = add_rule(index, 'pattern', 30.0, f"pattern_{pattern}")
+                literals = pattern_literals(pattern)
+                if literals is None:
+                    self._unfiltered_patterns.add(rule)
+                else:
+                    for literal in literals:
+                        pattern_triggers[keyword_id(literal)].append(rule)
+                self._patterns.append((index, re.compile(pattern, re.IGNORECASE), rule))
             
-            # Additional scoring for word boundaries (reduced for Data Science)
-            words = title_lower.split()
-            for word in words:
-                # Check if word is a technology keyword
-                if word in data.get('technologies', []):
-                    if category == 'Data Science':
-                        score += 1.0  # Very low score for individual tech words
-                    else:
-                        score += 5.0
-                    matches.append(word)
-                
-                # Check if word is part of a primary keyword
-                for primary in data.get('primary', []):
-                    if word in primary.split():
-                        if category == 'Data Science':
-                            score += 1.0  # Very low score for individual words
-                        else:
-                            score += 3.0
-                        matches.append(word)
-            
-            if score > 0:
-                category_scores[category] = score
-                category_matches[category] = matches
+            # Whole-word matches: a title word scores once if it is a technology and once
+            # for every primary keyword it is a word of
+            primary_words = [keyword.split() for keyword in primary]
+            tokens = dict.fromkeys(technologies)
+            for words in primary_words:
+                tokens.update(dict.fromkeys(words))
+            for token in tokens:
+                is_technology = token in technologies
+                primary_count = sum(1 for words in primary_words if token in words)
+                if is_data_science:
+                    weight = 1.0 * is_technology + 1.0 * primary_count
+                else:
+                    weight = 5.0 * is_technology + 3.0 * primary_count
+                rule = add_rule(index, 'token', weight, token, is_technology + primary_count)
+                self._token_rules.setdefault(token, []).append(rule)
+        
+        self.rule_key = [rule_key(identity) for identity in rule_identities(self)]
+        self._rule_by_key = {key: rule for rule, key in enumerate(self.rule_key)}
+        if len(self._rule_by_key) != len(self.rule_key):
+            raise ValueError("Two rules hash to the same rule key; rename one of their keywords")
+        
+        self._keywords = list(keyword_ids)
+        self.typo_index = None
+        if typo_tolerance:
+            self.typo_index = TypoIndex(
+                word
+                for data in categories.values()
+                for keyword in chain(data.get('primary', []), data.get('technologies', []),
+                                     data.get('exclusions', []))
+                for word in normalize_title(keyword).split()
+            )
+        self._automaton = KeywordAutomaton(keyword_ids)
+        self._keyword_rules = [tuple(rules) for rules in keyword_rules]
+        self._excluded_by = [frozenset(excluded) for excluded in excluded_by]
+        self._pattern_triggers = [tuple(triggers) for triggers in pattern_triggers]
+    
+    def __getstate__(self):
+        # The full automaton transition table is quicker to rebuild than to unpickle.
+        # The state only holds builtins, so it unpickles whether this module was
+        # __main__ or imported when it was written (see load_rules)
+        state = self.__dict__.copy()
+        del state['_automaton']
+        if self.typo_index is not None:
+            state['typo_index'] = self.typo_index.__getstate__()
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if isinstance(self.typo_index, dict):
+            typo_index = TypoIndex.__new__(TypoIndex)
+            typo_index.__dict__.update(self.typo_index)
+            self.typo_index = typo_index
+        self._automaton = KeywordAutomaton(self._keywords)
+    
+    def hits(self, title_lower):
+        """Return the ids of every rule a normalized title fires, in match order"""
+        if self.typo_index is not None:
+            title_lower = self.typo_index.correct(title_lower)
+        excluded = set()
+        literal_hits = []
+        candidates = set(self._unfiltered_patterns)
+        for keyword in self._automaton.find(title_lower):
+            excluded.update(self._excluded_by[keyword])
+            literal_hits.extend(self._keyword_rules[keyword])
+            candidates.update(self._pattern_triggers[keyword])
+        # IGNORECASE folding of non-ASCII text can match without the literal being present
+        if not title_lower.isascii():
+            candidates = None
+        
+        rule_category = self.rule_category
+        literal_hits.sort()
+        hits = [rule for rule in literal_hits if rule_category[rule] not in excluded]
+        
+        for category, regex, rule in self._patterns:
+            if category in excluded or (candidates is not None and rule not in candidates):
+                continue
+            if regex.search(title_lower):
+                hits.append(rule)
+        
+        for word in title_lower.split():
+            for rule in self._token_rules.get(word, ()):
+                if rule_category[rule] not in excluded:
+                    hits.append(rule)
+        
+        return hits
+    
+    def trace_hits(self, title_lower, profile):
+        """hits() with every rule accounted in a RuleProfile; much slower, profiling only"""
+        if self.typo_index is not None:
+            start = time.perf_counter()
+            title_lower = self.typo_index.correct(title_lower)
+            profile.stage_seconds['typos'] += time.perf_counter() - start
+        start = time.perf_counter()
+        keywords = self._automaton.find(title_lower)
+        profile.stage_seconds['automaton'] += time.perf_counter() - start
         
-        # Return the best category
-        if not category_scores:
-            return ('Other', 0.0, [])
+        excluded = set()
+        literal_hits = []
+        candidates = set(self._unfiltered_patterns)
+        for keyword in keywords:
+            if self._excluded_by[keyword]:
+                profile.exclusion_hits[keyword] += 1
+            excluded.update(self._excluded_by[keyword])
+            literal_hits.extend(self._keyword_rules[keyword])
+            candidates.update(self._pattern_triggers[keyword])
+        if not title_lower.isascii():
+            candidates = None
         
-        best_category = max(category_scores.items(), key=lambda x: x[1])
+        rule_category = self.rule_category
+        literal_hits.sort()
+        hits = [rule for rule in literal_hits if rule_category[rule] not in excluded]
+        
+        start = time.perf_counter()
+        for category, regex, rule in self._patterns:
+            if category in excluded or (candidates is not None and rule not in candidates):
+                continue
+            searched = time.perf_counter()
+            found = regex.search(title_lower)
+            profile.rule_seconds[rule] += time.perf_counter() - searched
+            profile.rule_evaluations[rule] += 1
+            if found:
+                hits.append(rule)
+        profile.stage_seconds['patterns'] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for word in title_lower.split():
+            for rule in self._token_rules.get(word, ()):
+                if rule_category[rule] not in excluded:
+                    hits.append(rule)
+        profile.stage_seconds['tokens'] += time.perf_counter() - start
+        
+        return hits
+    
+    def matched_rules(self, hits, category):
+        """The hits belonging to one category, as a tuple of rule ids in match order"""
+        rule_category = self.rule_category
+        return tuple(rule for rule in hits if rule_category[rule] == category)
+    
+    def expand_rules(self, rule_ids):
+        """Matched keywords of a tuple of rule ids: each rule's label, repeated as it scored"""
+        matches = []
+        for rule in rule_ids:
+            matches.extend([self.rule_label[rule]] * self.rule_repeat[rule])
+        return matches
+    
+    def format_matches(self, rule_ids, verbose=False):
+        """matched_keywords value of a result: 'key;key;...' (see rule_key) or, verbose,
+        'keyword; keyword; ...'"""
+        if verbose:
+            return '; '.join(self.expand_rules(rule_ids))
+        rule_key = self.rule_key
+        return MATCH_SEPARATOR.join([rule_key[rule] for rule in rule_ids])
+    
+    def parse_matches(self, matched_keywords):
+        """Rule numbers of a compact 'key;key;...' matched_keywords value"""
+        if not matched_keywords:
+            return ()
+        return tuple(self._rule_by_key[key] for key in matched_keywords.split(MATCH_SEPARATOR))
+    
+    def expand_matches(self, matched_keywords):
+        """Verbose matched_keywords value of a compact 'key;key;...' one"""
+        return '; '.join(self.expand_rules(self.parse_matches(matched_keywords)))
+    
+    def dictionary(self):
+        """Rule dictionary resolving the rule keys of compact matched_keywords values"""
+        return {
+            'version': RULE_DICTIONARY_VERSION,
+            'fingerprint': self.fingerprint,
+            'rules': [
+                {'id': self.rule_key[rule], 'category': self.category_names[category], 'kind': self.rule_kind[rule],
+                 'label': self.rule_label[rule], 'weight': self.rule_weight[rule],
+                 'repeat': self.rule_repeat[rule]}
+                for rule, category in enumerate(self.rule_category)
+            ]
+        }
+    
+    def best_category(self, hits):
+        """Index of the category the hits elect and its score, or (None, 0.0)"""
+        scores = [0.0] * len(self.category_names)
+        for rule in hits:
+            scores[self.rule_category[rule]] += self.rule_weight[rule]
+        
+        # First category with the highest positive score wins
+        best = None
+        for category, score in enumerate(scores):
+            if score > 0 and (best is None or score > scores[best]):
+                best = category
+        if best is None:
+            return None, 0.0
         
         # For Data Science, require a higher minimum score to prevent misclassification
-        if best_category[0] == 'Data Science' and best_category[1] < 20.0:
-            # If Data Science score is too low, try the next best category
-            other_categories = [(cat, score) for cat, score in category_scores.items() if cat != 'Data Science']
-            if other_categories:
-                best_category = max(other_categories, key=lambda x: x[1])
+        if self.category_names[best] == 'Data Science' and scores[best] < 20.0:
+            runner_up = None
+            for category, score in enumerate(scores):
+                if category != best and score > 0 and (runner_up is None or score > scores[runner_up]):
+                    runner_up = category
+            if runner_up is not None:
+                best = runner_up
+        return best, scores[best]
+    
+    def categorize(self, title_lower):
+        """Pick the best category for a normalized title: (category, confidence, rule ids)"""
+        hits = self.hits(title_lower)
+        best, score = self.best_category(hits)
+        if best is None:
+            return ('Other', 0.0, ())
         
         max_possible_score = 100.0
-        confidence_percentage = min(best_category[1] / max_possible_score * 100, 100)
+        confidence_percentage = min(score / max_possible_score * 100, 100.0)
+        
+        return (self.category_names[best], confidence_percentage, self.matched_rules(hits, best))
+    
+    def categorize_many(self, titles, cache=None):
+        """Categorize a batch of titles with one weighted title x rule matrix product
+        
+        Repeated titles are only matched once, and titles found in cache are not matched
+        at all. Returns columnar results aligned with titles: 'category' and
+        'confidence' arrays and a 'rules' list of matched rule id tuples, shared between
+        repeats of a title.
+        """
+        import numpy as np
+        unique_ids = {}
+        inverse = []
+        for title in titles:
+            title_lower = normalize_title(title) if title else ''
+            inverse.append(unique_ids.setdefault(title_lower, len(unique_ids)))
+        inverse = np.array(inverse, dtype=np.intp)
+        unique_titles = list(unique_ids)
+        
+        category = np.empty(len(unique_titles), dtype=object)
+        confidence = np.zeros(len(unique_titles))
+        rules = [None] * len(unique_titles)
+        misses = []
+        for unique_id, title_lower in enumerate(unique_titles):
+            cached = cache.get(self.fingerprint, title_lower) if cache is not None else None
+            if cached is None:
+                misses.append(unique_id)
+            else:
+                category[unique_id], confidence[unique_id], rules[unique_id] = cached
+        
+        if misses:
+            scored = self._score_batch([unique_titles[unique_id] for unique_id in misses])
+            category[misses] = scored['category']
+            confidence[misses] = scored['confidence']
+            for unique_id, title_category, title_confidence, title_rules in zip(
+                misses, scored['category'], scored['confidence'].tolist(), scored['rules']
+            ):
+                rules[unique_id] = title_rules
+                if cache is not None:
+                    cache.put(self.fingerprint, unique_titles[unique_id],
+                              (title_category, title_confidence, title_rules))
+        
+        return {
+            'category': category[inverse],
+            'confidence': confidence[inverse],
+            'rules': [rules[unique_id] for unique_id in inverse]
+        }
+    
+    def _score_batch(self, titles_lower):
+        """Score distinct normalized titles together and pick each one's category"""
+        import numpy as np
+        hits = [self.hits(title_lower) for title_lower in titles_lower]
+        
+        # Sparse title x rule incidence multiplied by the rule x category weights
+        category_count = len(self.category_names)
+        rows = np.repeat(np.arange(len(hits)), [len(title_hits) for title_hits in hits])
+        rules = np.fromiter(chain.from_iterable(hits), dtype=np.intp, count=len(rows))
+        scores = np.bincount(
+            rows * category_count + np.array(self.rule_category, dtype=np.intp)[rules],
+            weights=np.array(self.rule_weight, dtype=np.float64)[rules],
+            minlength=len(hits) * category_count
+        ).reshape(len(hits), category_count)
+        
+        # argmax keeps the first of tied categories, like max() in categorize
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(hits)), best]
+        
+        # For Data Science, require a higher minimum score to prevent misclassification
+        if 'Data Science' in self.category_names:
+            data_science = self.category_names.index('Data Science')
+            low = np.flatnonzero((best == data_science) & (best_scores > 0) & (best_scores < 20.0))
+            others = scores[low]
+            others[:, data_science] = 0.0
+            runner_up = others.argmax(axis=1)
+            runner_up_scores = others[np.arange(len(low)), runner_up]
+            has_runner_up = runner_up_scores > 0
+            best[low[has_runner_up]] = runner_up[has_runner_up]
+            best_scores[low[has_runner_up]] = runner_up_scores[has_runner_up]
+        
+        matched = best_scores > 0
+        max_possible_score = 100.0
+        confidence = np.where(matched, np.minimum(best_scores / max_possible_score * 100, 100), 0.0)
+        names = np.array(self.category_names + ['Other'], dtype=object)
+        
+        return {
+            'category': names[np.where(matched, best, category_count)],
+            'confidence': confidence,
+            'rules': [
+                self.matched_rules(title_hits, title_best) if title_matched else ()
+                for title_hits, title_best, title_matched in zip(hits, best, matched)
+            ]
+        }
+
+class RuleProfile:
+    """Hit counts and search time of every categorization rule over a corpus of titles
+    
+    Fill it with profile_rules(). Keyword and token rules are found by the shared
+    automaton and token index, whose time is only known per stage; regex patterns are
+    timed one by one. report() lists every rule and exclusion with its status: 'dead'
+    when it never fired, 'losing' when it only fired in titles won by another category.
+    """
+    
+    REPORT_FIELDS = ['rule', 'category', 'kind', 'label', 'hits', 'wins', 'evaluations',
+                     'seconds', 'status']
+    
+    def __init__(self, rules):
+        self.rules = rules
+        self.titles = 0
+        self.rule_hits = [0] * len(rules.rule_category)
+        self.rule_wins = [0] * len(rules.rule_category)
+        self.rule_evaluations = [0] * len(rules.rule_category)
+        self.rule_seconds = [0.0] * len(rules.rule_category)
+        self.exclusion_hits = Counter()   # keyword id -> titles it was found in
+        self.stage_seconds = {'typos': 0.0, 'automaton': 0.0, 'patterns': 0.0, 'tokens': 0.0}
+    
+    def add(self, title):
+        """Trace one raw title and credit its rules"""
+        hits = self.rules.trace_hits(normalize_title(title) if title else '', self)
+        best, _score = self.rules.best_category(hits)
+        self.titles += 1
+        for rule in set(hits):
+            self.rule_hits[rule] += 1
+            if self.rules.rule_category[rule] == best:
+                self.rule_wins[rule] += 1
+    
+    def report(self, sort_by='hits'):
+        """One dict per rule and per exclusion, sorted by sort_by (numbers descending)"""
+        rules = self.rules
+        rows = []
+        for rule, category in enumerate(rules.rule_category):
+            hits = self.rule_hits[rule]
+            wins = self.rule_wins[rule]
+            rows.append({
+                'rule': rule,
+                'category': rules.category_names[category],
+                'kind': rules.rule_kind[rule],
+                'label': rules.rule_label[rule],
+                'hits': hits,
+                'wins': wins,
+                'evaluations': self.rule_evaluations[rule],
+                'seconds': self.rule_seconds[rule],
+                'status': 'dead' if not hits else 'losing' if not wins else 'winning'
+            })
+        for keyword, categories in enumerate(rules._excluded_by):
+            for category in sorted(categories):
+                hits = self.exclusion_hits[keyword]
+                rows.append({
+                    'rule': None,
+                    'category': rules.category_names[category],
+                    'kind': 'exclusion',
+                    'label': rules._keywords[keyword],
+                    'hits': hits,
+                    'wins': None,
+                    'evaluations': None,
+                    'seconds': None,
+                    'status': 'dead' if not hits else 'active'
+                })
+        
+        if sort_by in ('category', 'kind', 'label', 'status'):
+            rows.sort(key=lambda row: row[sort_by])
+        else:
+            rows.sort(key=lambda row: -(row[sort_by] or 0))
+        return rows
+    
+    def write_report(self, path, sort_by='hits'):
+        """Write report() as a CSV"""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.REPORT_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self.report(sort_by))
+
+def profile_rules(titles, rules=None):
+    """Trace every categorization rule over an iterable of raw titles"""
+    if rules is None:
+        rules = create_accurate_categorizer(cache_size=0).rules
+    profile = RuleProfile(rules)
+    for title in titles:
+        profile.add(title)
+    return profile
+
+def load_category_rules(path=RULES_PATH):
+    """Read the category rule tables from a JSON rule file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def compiled_rules_path(path, key):
+    """Where the compiled rules of a rule file are cached: __pycache__ next to it"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__', f"{name}.{key[:16]}.pickle")
+
+_loaded_rules = {}  # cache key -> CategoryRules already loaded by this process
+
+def load_rules(path=RULES_PATH, typo_tolerance=True):
+    """Compiled CategoryRules of a rule file, built once and then loaded from disk
+    
+    The compiled rules are pickled next to the rule file under a key hashing its bytes,
+    the typo settings, COMPILED_RULES_VERSION and the Python version, so editing the
+    rule file or the compiler recompiles them. Within a process the same object is
+    returned for every call; a cache that cannot be read or written is rebuilt or
+    skipped silently.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    key_parts = [data, COMPILED_RULES_VERSION.encode(), sys.version.encode(),
+                 repr((typo_tolerance, TYPO_SETTINGS)).encode()]
+    key = hashlib.sha256(b'\0'.join(key_parts)).hexdigest()
+    rules = _loaded_rules.get(key)
+    if rules is not None:
+        return rules
+    
+    # Only the plain state is pickled, never the class, so the cache written by the
+    # command line (module __main__) is the one library users load, and vice versa
+    cache_path = compiled_rules_path(path, key)
+    rules = None
+    try:
+        with open(cache_path, 'rb') as f:
+            state = pickle.load(f)
+        if isinstance(state, dict):
+            rules = CategoryRules.__new__(CategoryRules)
+            rules.__setstate__(state)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, KeyError, TypeError):
+        rules = None
+    
+    if rules is None:
+        rules = CategoryRules(json.loads(data), typo_tolerance)
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, 'wb') as f:
+                pickle.dump(rules.__getstate__(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+    
+    _loaded_rules[key] = rules
+    return rules
+
+def create_accurate_categorizer(cache_size=50000, typo_tolerance=True, rules_path=RULES_PATH):
+    """Create accurate categorization system
+    
+    The rules come from the rule file at rules_path (see load_rules). Results are
+    memoized per normalized title in an LRU cache of cache_size entries (0 disables it);
+    categorize_job.cache_info() reports its counters. typo_tolerance corrects misspelled
+    title words before matching (see TypoIndex). categorize_job.match(title) returns the
+    matched rule ids instead of the matched keywords.
+    """
+    
+    cache = CategorizationCache(cache_size)
+    
+    def match(title):
+        """(category, confidence, matched rule ids) of a title"""
+        if not title:
+            return ('Other', 0.0, ())
         
-        return (best_category[0], confidence_percentage, category_matches[best_category[0]])
+        # Rules are looked up on every call so replacing them invalidates the cache
+        rules = categorize_job.rules
+        title_lower = normalize_title(title)
+        result = cache.get(rules.fingerprint, title_lower)
+        if result is None:
+            result = rules.categorize(title_lower)
+            cache.put(rules.fingerprint, title_lower, result)
+        return result
     
+    def categorize_job(title, description=None):
+        """Categorize a job with very precise matching and exclusions"""
+        category, confidence, rule_ids = match(title)
+        return (category, confidence, categorize_job.rules.expand_rules(rule_ids))
+    
+    categorize_job.match = match
+    categorize_job.rules = load_rules(rules_path, typo_tolerance)
+    categorize_job.cache = cache
+    categorize_job.cache_info = cache.info
     return categorize_job
 
-def main():
-    """Main function to fix titles and categorize jobs"""
+def categorize_titles(titles, categorizer=None, verbose=False):
+    """Categorize raw titles one by one into {title, category, category_confidence,
+    matched_keywords} dicts, in pure Python without importing numpy or pandas"""
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    for title in titles:
+        category, confidence, rule_ids = categorizer.match(title)
+        yield {'title': title, 'category': category, 'category_confidence': confidence,
+               'matched_keywords': categorizer.rules.format_matches(rule_ids, verbose)}
+
+def categorize_many(titles, categorizer=None):
+    """Categorize many titles at once, returning columnar category/confidence/rules results"""
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    return categorizer.rules.categorize_many(titles, getattr(categorizer, 'cache', None))
+
+CSV_COLUMNS = [
+    'company', 'title', 'location', 'salary', 'time_posted', 'tags',
+    'salary_min', 'salary_max', 'days_ago', 'category', 'category_confidence', 'matched_keywords'
+]
+
+def parse_raw_block(block):
+    """Fix and parse one raw job block, or return None if it is not a complete job"""
+    fixed_block = fix_job_block(block)
+    if fixed_block is None:
+        return None
+    return parse_job_block(fixed_block)
+
+def iter_jobs(path):
+    """Stream parsed jobs out of one or more raw dumps, fixing titles on the fly"""
+    for block in iter_input_blocks(path):
+        job = parse_raw_block(block)
+        if job is not None:
+            yield job
+
+def extract_job_fields(job):
+    """Add the numeric salary range and posting age parsed from a job's text fields"""
+    job['salary_min'], job['salary_max'] = extract_salary_range(job['salary'])
+    job['days_ago'] = extract_days_ago(job['time_posted'])
+    return job
+
+def extract_jobs_fields(jobs):
+    """Batch extract_job_fields: extract a whole list of jobs column-wise at once"""
+    salary_min, salary_max = extract_salary_ranges([job['salary'] for job in jobs])
+    days_ago = extract_days_ago_many([job['time_posted'] for job in jobs])
+    for job, low, high, days in zip(jobs, salary_min.tolist(), salary_max.tolist(), days_ago.tolist()):
+        # NaN marks a missing value, which rows carry as None
+        job['salary_min'] = low if low == low else None
+        job['salary_max'] = high if high == high else None
+        job['days_ago'] = days if days == days else None
+    return jobs
+
+def add_categories(jobs, categorizer):
+    """Categorize a list of jobs in one batch, adding the category columns to each
     
-    print("🚀 Starting complete job data fix and categorization...")
+    matched_keywords holds the matched rule keys ('key;key;...', see format_matches); the
+    rule dictionary or CategoryRules.expand_matches turns them back into keywords.
+    """
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    results = categorize_many([job['title'] for job in jobs], categorizer)
+    format_matches = categorizer.rules.format_matches
+    formatted = {}
+    for job, category, confidence, rule_ids in zip(
+        jobs, results['category'], results['confidence'].tolist(), results['rules']
+    ):
+        job['category'] = category
+        job['category_confidence'] = confidence
+        keywords = formatted.get(rule_ids)
+        if keywords is None:
+            keywords = formatted[rule_ids] = format_matches(rule_ids)
+        job['matched_keywords'] = keywords
+    return jobs
+
+def iter_categorized_jobs(jobs, categorizer=None, batch_size=10000):
+    """Add salary, posting age and category columns to a stream of jobs
+    
+    Jobs are categorized with categorize_many in batches of batch_size, so memory stays
+    bounded by one batch.
+    """
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    
+    for batch in iter_chunks(jobs, batch_size):
+        yield from add_categories(extract_jobs_fields(batch), categorizer)
+
+def iter_chunks(items, size):
+    """Group an iterable into lists of at most size items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# Per-stage instrumentation
+PIPELINE_STAGES = ['fix', 'parse', 'dedupe', 'extract', 'categorize', 'write', 'summary']
+
+def peak_rss_mb():
+    """Peak resident set size of this process and of its finished children, in MB"""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+class PipelineStats:
+    """Wall time, CPU time and rows in/out of each pipeline stage, plus row counters
+    
+    Counters are blocks_skipped_short (fewer than 3 lines), blocks_skipped_incomplete
+    (no company or title), duplicates_exact, duplicates_near, missing_salary and
+    missing_days_ago. Worker processes keep their own stats and the parent merges them
+    with merge().
+    """
+    
+    def __init__(self):
+        self.stages = {
+            stage: {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows_in': 0, 'rows_out': 0}
+            for stage in PIPELINE_STAGES
+        }
+        self.counters = Counter()
+    
+    @contextmanager
+    def stage(self, name):
+        """Time a block of work as part of stage name; the caller adds rows_in/rows_out"""
+        record = self.stages[name]
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] += time.perf_counter() - wall
+            record['cpu_seconds'] += time.process_time() - cpu
+    
+    def merge(self, other):
+        """Add the as_dict() output of another PipelineStats, e.g. from a worker"""
+        for name, record in other['stages'].items():
+            for key, value in record.items():
+                self.stages[name][key] += value
+        self.counters.update(other['counters'])
+    
+    def as_dict(self):
+        return {'stages': self.stages, 'counters': dict(self.counters)}
+
+# Duplicate postings: repeats of the same normalized (company, title, location) are
+# dropped; with near dedupe, titles of one company whose MinHash signatures over
+# character shingles agree on at least NEAR_DUPLICATE_THRESHOLD of their slots are
+# dropped too, found through LSH buckets of MINHASH_BANDS bands (8 bands of 4 slots
+# catch most pairs above ~0.6)
+DEDUPE_MODES = ['none', 'exact', 'near']
+SHINGLE_SIZE = 4
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 8
+MINHASH_PRIME = (1 << 32) - 5
+NEAR_DUPLICATE_THRESHOLD = 0.8
+DEDUPE_FIELD_CACHE_SIZE = 4096   # normalized companies and locations, which repeat a lot
+SHINGLE_CACHE_SIZE = 1 << 16      # shingle hashes, as titles share most of their shingles
+
+class JobDeduplicator:
+    """Streaming duplicate filter for parsed jobs or rows
+    
+    mode 'exact' drops exact duplicates, 'near' drops near duplicates too and 'none'
+    keeps everything. Exact duplicates are found by an 8-byte hash of the normalized key,
+    the only thing kept per job in 'exact' mode. In 'near' mode every kept job also keeps
+    its MinHash signature (one uint32 row) and a hash per LSH band, and is only compared
+    with jobs of the same company that share a band, so each job costs a few dict lookups
+    rather than a scan of every job before it. The first job of a group is kept, so output
+    does not depend on how the input is chunked. near_duplicates records every near
+    duplicate dropped: its company, title and location, the output row of the kept job
+    it duplicates and their similarity (see write_duplicates).
+    """
+    
+    def __init__(self, mode='exact', threshold=NEAR_DUPLICATE_THRESHOLD):
+        import numpy as np
+        if mode not in DEDUPE_MODES:
+            raise ValueError(f"Unknown dedupe mode {mode!r}; expected one of {DEDUPE_MODES}")
+        self.mode = mode
+        self.threshold = threshold
+        self.near_duplicates = []
+        self.rows_kept = 0   # output row of the next job kept
+        self._exact = set()
+        self._fields = {}    # company or location -> normalized, cleared when full
+        self._shingles = {}  # shingle -> crc32, cleared when full
+        self._buckets = {}   # hash of (company, band, band slots) -> representative id
+        self._signatures = np.empty((0, MINHASH_PERMUTATIONS), dtype=np.uint32)
+        self._representatives = 0
+        self._rows = array('q')   # representative id -> output row
+        rng = np.random.default_rng(MINHASH_PERMUTATIONS)
+        self._a = rng.integers(1, 1 << 31, MINHASH_PERMUTATIONS, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, MINHASH_PERMUTATIONS, dtype=np.uint64)
+    
+    def signatures(self, titles_lower):
+        """MinHash signatures (one row of MINHASH_PERMUTATIONS slots per title) of titles"""
+        import numpy as np
+        shingles = [
+            [title[i:i + SHINGLE_SIZE] for i in range(max(1, len(title) - SHINGLE_SIZE + 1))]
+            for title in titles_lower
+        ]
+        counts = [len(title_shingles) for title_shingles in shingles]
+        if len(self._shingles) >= SHINGLE_CACHE_SIZE:
+            self._shingles.clear()
+        cache = self._shingles
+        hashes = np.fromiter(
+            (cache[shingle] if shingle in cache
+             else cache.setdefault(shingle, zlib.crc32(shingle.encode('utf-8')))
+             for shingle in chain.from_iterable(shingles)),
+            dtype=np.uint64, count=sum(counts)
+        )
+        permuted = (hashes[:, None] * self._a + self._b) % MINHASH_PRIME
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        return np.minimum.reduceat(permuted, starts, axis=0).astype(np.uint32)
+    
+    def filter(self, jobs, stats=None):
+        """The jobs that are not duplicates of a job seen before, counted in stats"""
+        import numpy as np
+        if stats is None:
+            stats = PipelineStats()
+        if self.mode == 'none' or not jobs:
+            self.rows_kept += len(jobs)
+            return jobs
+        with stats.stage('dedupe') as record:
+            record['rows_in'] += len(jobs)
+            unique, companies, titles_lower = [], [], []
+            for job in jobs:
+                company, location = self._normalized(job['company']), self._normalized(job['location'])
+                title = normalize_title(job['title'] or '')
+                digest = hashlib.blake2b('\x1f'.join((company, title, location)).encode('utf-8'),
+                                         digest_size=8).digest()
+                if digest in self._exact:
+                    stats.counters['duplicates_exact'] += 1
+                else:
+                    self._exact.add(digest)
+                    unique.append(job)
+                    companies.append(company)
+                    titles_lower.append(title)
+            
+            if self.mode == 'exact' or not unique:
+                kept = unique
+                self.rows_kept += len(kept)
+            else:
+                kept = []
+                # Signatures per distinct title, as one title is often posted by many companies
+                titles = {}
+                title_ids = [titles.setdefault(title, len(titles)) for title in titles_lower]
+                signatures = self.signatures(list(titles))[title_ids]
+                # The slots of each band as one bytes value, shape (jobs, MINHASH_BANDS)
+                band_slots = signatures.view(np.dtype((np.void, signatures.itemsize * MINHASH_PERMUTATIONS
+                                                       // MINHASH_BANDS))).tolist()
+                for job, company, signature, slots in zip(unique, companies, signatures, band_slots):
+                    match = self._near_duplicate(company, signature, slots)
+                    if match is not None:
+                        representative, similarity = match
+                        stats.counters['duplicates_near'] += 1
+                        self.near_duplicates.append({
+                            'company': job['company'],
+                            'title': job['title'],
+                            'location': job['location'],
+                            'duplicate_of': self._rows[representative],
+                            'similarity': similarity
+                        })
+                        continue
+                    kept.append(job)
+                    self.rows_kept += 1
+            record['rows_out'] += len(kept)
+        return kept
+    
+    def _normalized(self, value):
+        normalized = self._fields.get(value)
+        if normalized is None:
+            if len(self._fields) >= DEDUPE_FIELD_CACHE_SIZE:
+                self._fields.clear()
+            normalized = self._fields[value] = normalize_title(value or '')
+        return normalized
+    
+    def _near_duplicate(self, company, signature, band_slots):
+        """(representative id, similarity) of the kept job this one nearly duplicates, or
+        None after indexing the job as a new representative"""
+        import numpy as np
+        keys = [hash((company, band, slots)) for band, slots in enumerate(band_slots)]
+        # Band hashes may collide, which only adds a candidate that fails the threshold
+        best, best_similarity = None, 0.0
+        for candidate in {self._buckets[key] for key in keys if key in self._buckets}:
+            similarity = np.count_nonzero(self._signatures[candidate] == signature) / MINHASH_PERMUTATIONS
+            if similarity > best_similarity:
+                best, best_similarity = candidate, similarity
+        if best is not None and best_similarity >= self.threshold:
+            return best, best_similarity
+        
+        representative = self._representatives
+        if representative == len(self._signatures):
+            grown = np.empty((max(1024, 2 * representative), MINHASH_PERMUTATIONS), dtype=np.uint32)
+            grown[:representative] = self._signatures
+            self._signatures = grown
+        self._signatures[representative] = signature
+        self._representatives += 1
+        self._rows.append(self.rows_kept)
+        for key in keys:
+            self._buckets.setdefault(key, representative)
+        return None
+
+def fix_blocks(blocks, stats):
+    """Fix stage: repaired blocks, None for blocks too short to be a job"""
+    with stats.stage('fix') as record:
+        fixed = [fix_job_block(block) for block in blocks]
+        record['rows_in'] += len(blocks)
+        skipped = fixed.count(None)
+        record['rows_out'] += len(blocks) - skipped
+    stats.counters['blocks_skipped_short'] += skipped
+    return fixed
+
+def parse_blocks(fixed_blocks, stats):
+    """Parse stage: jobs for the fixed blocks, None where a block is not a complete job"""
+    with stats.stage('parse') as record:
+        jobs = [parse_job_block(block) if block is not None else None for block in fixed_blocks]
+        rows_in = len(fixed_blocks) - fixed_blocks.count(None)
+        rows_out = len(jobs) - jobs.count(None)
+        record['rows_in'] += rows_in
+        record['rows_out'] += rows_out
+    stats.counters['blocks_skipped_incomplete'] += rows_in - rows_out
+    return jobs
+
+def extract_stage(jobs, stats):
+    """Extract stage over a list of jobs, counting rows left without a salary or age"""
+    with stats.stage('extract') as record:
+        extract_jobs_fields(jobs)
+        record['rows_in'] += len(jobs)
+        record['rows_out'] += len(jobs)
+    stats.counters['missing_salary'] += sum(job['salary_min'] is None for job in jobs)
+    stats.counters['missing_days_ago'] += sum(job['days_ago'] is None for job in jobs)
+    return jobs
+
+def categorize_stage(jobs, categorizer, stats):
+    """Categorize stage over a list of jobs"""
+    with stats.stage('categorize') as record:
+        add_categories(jobs, categorizer)
+        record['rows_in'] += len(jobs)
+        record['rows_out'] += len(jobs)
+    return jobs
+
+def process_blocks(blocks, categorizer, stats, deduplicator=None):
+    """Fix, parse, extract and categorize one chunk of raw job blocks, dropping the
+    duplicates deduplicator has already seen before extraction when one is given"""
+    jobs = [job for job in parse_blocks(fix_blocks(blocks, stats), stats) if job is not None]
+    if deduplicator is not None:
+        jobs = deduplicator.filter(jobs, stats)
+    return categorize_stage(extract_stage(jobs, stats), categorizer, stats)
+
+# Process-pool mode: every worker compiles its own categorizer once at startup
+_worker_categorizer = None
+
+def _init_worker(rules_path=RULES_PATH):
+    global _worker_categorizer
+    _worker_categorizer = create_accurate_categorizer(rules_path=rules_path)
+
+def _process_blocks(blocks):
+    """Fix, parse, extract and categorize one chunk of raw job blocks inside a worker"""
+    stats = PipelineStats()
+    rows = process_blocks(blocks, _worker_categorizer, stats)
+    return rows, stats.as_dict()
+
+def _process_range(path, start, end):
+    """Read, fix, parse, extract and categorize one byte range of a dump inside a worker"""
+    return _process_blocks(list(iter_job_blocks_mmap(path, start, end)))
+
+def _range_bytes(path, chunk_size):
+    """Bytes holding about chunk_size blocks, estimated from the head of the dump"""
+    with open(path, 'rb') as f:
+        head = f.read(1 << 16)
+    return max(1, len(head) * chunk_size // (head.count(b'\n\n') + 1))
+
+def iter_categorized_blocks(path, categorizer=None, chunk_size=2000, stats=None, deduplicator=None):
+    """Run the whole pipeline over one or more raw dumps in-process, chunk_size blocks at a time"""
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    if stats is None:
+        stats = PipelineStats()
+    for blocks in iter_chunks(iter_input_blocks(path), chunk_size):
+        yield from process_blocks(blocks, categorizer, stats, deduplicator)
+
+def iter_categorized_jobs_parallel(path, workers=None, chunk_size=2000, stats=None, rules_path=RULES_PATH):
+    """Run the whole pipeline over a raw dump in a process pool, yielding rows in input order
+    
+    Regular files are split into byte ranges of about chunk_size blocks that workers
+    memory-map and read themselves (see job_block_ranges); stdin and files with \\r line
+    endings are read here and sent as chunks of chunk_size blocks. At most two tasks per
+    worker are in flight, so memory stays bounded like the serial pipeline. path may be
+    a list of dumps, so the tasks of several small dumps are processed at the same time
+    and still come back in input order. Stage times in stats are summed over the workers.
+    Workers load the compiled rules of rules_path from the on-disk cache (see load_rules).
+    """
+    workers = workers or os.cpu_count() or 1
+    if stats is None:
+        stats = PipelineStats()
+    paths = [path] if isinstance(path, str) else path
+    
+    def tasks():
+        for one_path in paths:
+            if one_path != '-' and os.path.isfile(one_path) and not _has_carriage_returns(one_path):
+                for start, end in job_block_ranges(one_path, _range_bytes(one_path, chunk_size)):
+                    yield _process_range, (one_path, start, end)
+            else:
+                for chunk in iter_chunks(iter_job_blocks(one_path), chunk_size):
+                    yield _process_blocks, (chunk,)
+    
+    def collect(future):
+        rows, chunk_stats = future.result()
+        stats.merge(chunk_stats)
+        return rows
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Compile once here so every worker finds the rules cached on disk
+    load_rules(rules_path)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules_path,)) as executor:
+        pending = deque()
+        for function, args in tasks():
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= 2 * workers:
+                yield from collect(pending.popleft())
+        while pending:
+            yield from collect(pending.popleft())
+
+# Incremental mode: parsed and categorized blocks persist between runs in SQLite
+STORE_PARSE_VERSION = '1'  # bump whenever fixing, parsing or extraction changes
+
+def block_hash(block):
+    """Content hash identifying a raw job block across runs"""
+    return hashlib.blake2b(block.encode('utf-8'), digest_size=16).hexdigest()
+
+class JobStore:
+    """SQLite store of parsed and categorized job blocks keyed by block content hash
+    
+    Each block keeps its parsed job (NULL when the block is not a job) and the category
+    columns together with the fingerprint of the rules that produced them.
+    """
+    
+    def __init__(self, path):
+        import sqlite3
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS blocks (
+                hash TEXT PRIMARY KEY,
+                job TEXT,
+                rules TEXT,
+                category TEXT,
+                category_confidence REAL,
+                matched_keywords TEXT
+            );
+        """)
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'parse_version'").fetchone()
+        if row is None or row[0] != STORE_PARSE_VERSION:
+            # Parsed jobs from another parser version cannot be trusted
+            with self.connection:
+                self.connection.execute("DELETE FROM blocks")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('parse_version', ?)", (STORE_PARSE_VERSION,)
+                )
+    
+    def lookup(self, hashes):
+        """Return {hash: (job, rules fingerprint, category columns)} for the known hashes"""
+        hashes = list(hashes)
+        found = {}
+        for start in range(0, len(hashes), 500):
+            batch = hashes[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT * FROM blocks WHERE hash IN ({', '.join('?' * len(batch))})", batch
+            )
+            for block, job, rules, category, confidence, keywords in rows:
+                found[block] = (json.loads(job) if job is not None else None, rules,
+                                (category, confidence, keywords))
+        return found
+    
+    def save(self, records):
+        """Insert or replace {hash: (job, rules fingerprint, category columns)} records"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (block, json.dumps(job) if job is not None else None, rules, *categories)
+                    for block, (job, rules, categories) in records.items()
+                ]
+            )
     
-    # Step 1: Fix duplicated titles
-    fixed_jobs = fix_duplicated_titles()
+    def close(self):
+        self.connection.close()
+
+def iter_categorized_jobs_incremental(path, store, categorizer=None, chunk_size=2000, stats=None,
+                                      pipeline_stats=None):
+    """Run the pipeline over a raw dump, reusing every block already in store
     
-    # Step 2: Parse fixed jobs
-    jobs = parse_fixed_jobs()
+    New or changed blocks are fixed, parsed and categorized; known blocks whose rules
+    fingerprint is stale are only re-categorized. Rows come out in input order, exactly
+    as a full run would produce them. Counts of parsed, re-categorized and reused
+    blocks are added to stats when given, and stage timings to pipeline_stats.
+    """
+    if categorizer is None:
+        categorizer = create_accurate_categorizer()
+    fingerprint = categorizer.rules.fingerprint
+    if stats is None:
+        stats = {}
+    for key in ('parsed', 'recategorized', 'reused'):
+        stats.setdefault(key, 0)
+    if pipeline_stats is None:
+        pipeline_stats = PipelineStats()
     
-    # Step 3: Create DataFrame
-    df = pd.DataFrame(jobs)
+    for blocks in iter_chunks(iter_input_blocks(path), chunk_size):
+        hashes = [block_hash(block) for block in blocks]
+        known = store.lookup(set(hashes))
+        
+        new_blocks = {}
+        for block, block_id in zip(blocks, hashes):
+            if block_id not in known:
+                new_blocks.setdefault(block_id, block)
+        new_jobs = parse_blocks(fix_blocks(list(new_blocks.values()), pipeline_stats), pipeline_stats)
+        extract_stage([job for job in new_jobs if job is not None], pipeline_stats)
+        changed = {block_id: (job, None, (None, None, None)) for block_id, job in zip(new_blocks, new_jobs)}
+        stats['parsed'] += len(changed)
+        for block_id, record in known.items():
+            if record[0] is not None and record[1] != fingerprint:
+                changed[block_id] = record
+                stats['recategorized'] += 1
+            else:
+                stats['reused'] += 1
+        
+        # Categorize new and stale jobs in one batch, then persist them
+        stale = [block_id for block_id, record in changed.items() if record[0] is not None]
+        jobs = categorize_stage([dict(changed[block_id][0]) for block_id in stale], categorizer, pipeline_stats)
+        for block_id, job in zip(stale, jobs):
+            changed[block_id] = (
+                changed[block_id][0], fingerprint,
+                (job['category'], job['category_confidence'], job['matched_keywords'])
+            )
+        store.save(changed)
+        known.update(changed)
+        
+        for block_id in hashes:
+            job, _rules, (category, confidence, keywords) = known[block_id]
+            if job is not None:
+                yield dict(job, category=category, category_confidence=confidence,
+                           matched_keywords=keywords)
+
+INDEX_VERSION = '2'  # bump whenever TitleIndex stores titles or results differently
+
+def index_path_for(output_path):
+    """Where the title index of an output file goes: next to it, as .index.pickle"""
+    return os.path.splitext(output_path)[0] + '.index.pickle'
+
+def _longest_piece(text):
+    """Longest whitespace-free piece of a keyword or literal, which a single title word
+    must contain for the whole text to occur in a title"""
+    return max(text.lower().split(), key=len, default='')
+
+class TitleIndex:
+    """Inverted index from title words to the distinct titles of an output file
     
-    # Step 4: Extract additional data
-    print("📊 Extracting salary and time data...")
+    Every output row points at its normalized title, and every title keeps the category,
+    confidence and rule ids it was given and the rule tables that gave them. After a rule
+    edit only the titles containing a word the edit touches are re-scored (see
+    affected_titles), so the output can be patched without running the pipeline again.
+    """
     
-    salary_ranges = [extract_salary_range(salary) for salary in df['salary']]
-    df['salary_min'] = [s[0] for s in salary_ranges]
-    df['salary_max'] = [s[1] for s in salary_ranges]
+    def __init__(self, rules, verbose=False, output_format='csv'):
+        self.version = INDEX_VERSION
+        self.categories = rules.categories
+        self.typo_tolerance = rules.typo_tolerance
+        self.fingerprint = rules.fingerprint
+        self.verbose = verbose
+        self.output_format = output_format
+        self.titles = []              # title id -> normalized title
+        self.category = []            # title id -> category
+        self.confidence = array('d')  # title id -> category confidence
+        self.rules = []               # title id -> matched rule numbers
+        self.row_titles = array('i')  # output row -> title id
+        self.postings = {}            # title word -> ids of the titles containing it
+        self._title_ids = {}
+        self._parse_matches = rules.parse_matches
     
-    df['days_ago'] = [extract_days_ago(time) for time in df['time_posted']]
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_title_ids'] = {}
+        state['_parse_matches'] = None
+        return state
     
-    # Step 5: Categorize jobs
-    print("🏷️ Categorizing jobs...")
-    categorizer = create_accurate_categorizer()
+    def __len__(self):
+        return len(self.row_titles)
     
-    categories = []
-    confidences = []
-    keywords_list = []
+    def add(self, row):
+        """Index one output row whose matched_keywords still holds rule keys"""
+        title_id = self._title_ids.get(row['title'])
+        if title_id is None:
+            title_lower = normalize_title(row['title']) if row['title'] else ''
+            title_id = self._title_ids.get(title_lower)
+            if title_id is None:
+                title_id = self._title_ids[title_lower] = len(self.titles)
+                self.titles.append(title_lower)
+                self.category.append(row['category'])
+                self.confidence.append(row['category_confidence'])
+                self.rules.append(self._parse_matches(row['matched_keywords']))
+                for word in set(title_lower.split()):
+                    self.postings.setdefault(word, array('i')).append(title_id)
+            self._title_ids[row['title']] = title_id
+        self.row_titles.append(title_id)
     
-    for title in df['title']:
-        category, confidence, keywords = categorizer(title)
-        categories.append(category)
-        confidences.append(confidence)
-        keywords_list.append('; '.join(keywords) if keywords else '')
+    def save(self, path):
+        # Only the state is pickled, so the file loads whether this module ran as
+        # __main__ or was imported
+        with open(path, 'wb') as f:
+            pickle.dump(self.__getstate__(), f, protocol=pickle.HIGHEST_PROTOCOL)
     
-    df['category'] = categories
-    df['category_confidence'] = confidences
-    df['matched_keywords'] = keywords_list
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        if not isinstance(state, dict) or state.get('version') != INDEX_VERSION:
+            raise ValueError(f"{path} is not a title index of this version; run the pipeline with --index again")
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
     
-    # Step 6: Save results with proper CSV handling
-    df.to_csv('complete_categorized_jobs.csv', index=False, quoting=1)  # QUOTE_ALL to handle commas in fields
+    def affected_titles(self, old_rules, new_rules):
+        """Ids of the titles whose result going from old_rules to new_rules can change,
+        or None when every title has to be re-scored
+        
+        A title can only change when a rule, exclusion or typo correction that differs
+        between the two fires on it, and each of those needs some title word to contain
+        a known piece of text, so only the index vocabulary is scanned.
+        """
+        if old_rules.typo_tolerance != new_rules.typo_tolerance:
+            return None
+        # Results computed under other typo settings cannot be diffed rule by rule
+        if old_rules.fingerprint != self.fingerprint:
+            return None
+        # Ties go to the first category, so the categories both keep must stay in order
+        kept = [name for name in old_rules.category_names if name in new_rules.categories]
+        if kept != [name for name in new_rules.category_names if name in old_rules.categories]:
+            return None
+        
+        tables = []
+        for rules in (old_rules, new_rules):
+            tables.append({identity: (rules.rule_weight[rule], rules.rule_repeat[rule])
+                           for rule, identity in enumerate(rule_identities(rules))})
+        triggers = set()
+        for table, other in ((tables[0], tables[1]), (tables[1], tables[0])):
+            for identity, value in table.items():
+                if other.get(identity) != value:
+                    triggers.add(identity[1:3])
+        for name in set(old_rules.categories) | set(new_rules.categories):
+            old_exclusions = set(old_rules.categories.get(name, {}).get('exclusions', []))
+            new_exclusions = set(new_rules.categories.get(name, {}).get('exclusions', []))
+            triggers.update(('exclusion', keyword) for keyword in old_exclusions ^ new_exclusions)
+        
+        # Words are matched as the typo index corrects them, before and after the edit
+        words = list(self.postings)
+        forms = [{word} for word in words]
+        for rules in (old_rules, new_rules):
+            if rules.typo_index is not None:
+                for word_forms, word in zip(forms, words):
+                    word_forms.add(rules.typo_index.lookup(word))
+        affected_words = {word for word, word_forms in zip(words, forms) if len(word_forms) > 1}
+        
+        tokens, pieces, non_ascii = set(), set(), False
+        for kind, label in triggers:
+            if kind == 'token':
+                tokens.add(label)
+                continue
+            if kind == 'pattern':
+                literals = pattern_literals(label[len('pattern_'):])
+                if literals is None:
+                    return None
+                # Non-ASCII titles are searched without the literal prefilter
+                non_ascii = True
+            else:
+                literals = [label]
+            for literal in literals:
+                piece = _longest_piece(literal)
+                if not piece:
+                    return None
+                pieces.add(piece)
+        
+        for word, word_forms in zip(words, forms):
+            if (word_forms & tokens
+                    or any(piece in form for form in word_forms for piece in pieces)
+                    or (non_ascii and not all(form.isascii() for form in word_forms))):
+                affected_words.add(word)
+        
+        affected = set()
+        for word in affected_words:
+            affected.update(self.postings[word])
+        return affected
+    
+    def rescore(self, old_rules, new_rules):
+        """Move the index from old_rules to new_rules, re-scoring only the affected titles
+        
+        The other titles keep their results with their rule ids renumbered. Returns
+        ({title id: (category, confidence, matched_keywords)} for the titles whose output
+        values changed, number of titles re-scored).
+        """
+        affected = self.affected_titles(old_rules, new_rules)
+        new_ids = {identity: rule for rule, identity in enumerate(rule_identities(new_rules))}
+        remap = [new_ids.get(identity) for identity in rule_identities(old_rules)]
+        kept = [rule for rule in remap if rule is not None]
+        if affected is None or kept != sorted(kept):
+            # Rules that changed order would come out of hits() in another order
+            affected = set(range(len(self.titles)))
+        
+        new_rules_of = {}
+        for title_id, rule_ids in enumerate(self.rules):
+            if title_id in affected:
+                continue
+            renumbered = tuple(remap[rule] for rule in rule_ids)
+            if None in renumbered:
+                affected.add(title_id)
+            else:
+                new_rules_of[title_id] = renumbered
+        
+        affected = sorted(affected)
+        results = new_rules.categorize_many([self.titles[title_id] for title_id in affected])
+        new_results = {title_id: (self.category[title_id], self.confidence[title_id], rule_ids)
+                       for title_id, rule_ids in new_rules_of.items()}
+        for title_id, category, confidence, rule_ids in zip(
+            affected, results['category'], results['confidence'].tolist(), results['rules']
+        ):
+            new_results[title_id] = (category, confidence, rule_ids)
+        
+        changed = {}
+        for title_id, (category, confidence, rule_ids) in new_results.items():
+            keywords = new_rules.format_matches(rule_ids, self.verbose)
+            if (category != self.category[title_id] or confidence != self.confidence[title_id]
+                    or keywords != old_rules.format_matches(self.rules[title_id], self.verbose)):
+                changed[title_id] = (category, confidence, keywords)
+            self.category[title_id] = category
+            self.confidence[title_id] = confidence
+            self.rules[title_id] = rule_ids
+        
+        self.categories = new_rules.categories
+        self.fingerprint = new_rules.fingerprint
+        return changed, len(affected)
+
+@contextmanager
+def replacing(path):
+    """Temporary path to write a file at; it replaces path once written in full, so a
+    reader of path (see categorize_server.py --jobs) never sees a partial file"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+def patch_jobs_output(path, index, changed):
+    """Rewrite the category columns of the rows whose title changed in a CSV or JSON lines
+    output, leaving every other row as it was; returns how many rows changed"""
+    if index.output_format not in ('csv', 'jsonl'):
+        raise ValueError(f"Only csv and jsonl outputs can be patched, not {index.output_format}")
+    row_titles = index.row_titles
+    patched = 0
+    rows = 0
+    with replacing(path) as temp_path, open(path, 'r', encoding='utf-8', newline='') as source, \
+            open(temp_path, 'w', encoding='utf-8', newline='') as target:
+        if index.output_format == 'csv':
+            reader = csv.reader(source)
+            writer = csv.writer(target, quoting=csv.QUOTE_ALL, lineterminator='\n')
+            header = next(reader)
+            writer.writerow(header)
+            columns = [header.index(column) for column in ('category', 'category_confidence', 'matched_keywords')]
+            for row in reader:
+                values = changed.get(row_titles[rows]) if rows < len(row_titles) else None
+                if values is not None:
+                    for column, value in zip(columns, values):
+                        row[column] = value
+                    patched += 1
+                writer.writerow(row)
+                rows += 1
+        else:
+            for line in source:
+                values = changed.get(row_titles[rows]) if rows < len(row_titles) else None
+                if values is not None:
+                    row = json.loads(line)
+                    row['category'], row['category_confidence'], row['matched_keywords'] = values
+                    line = json.dumps(row, ensure_ascii=False) + '\n'
+                    patched += 1
+                target.write(line)
+                rows += 1
+        if rows != len(row_titles):
+            raise ValueError(f"{path} has {rows} rows but its index has {len(row_titles)}; run the pipeline again")
+    return patched
+
+def write_jobs_csv(rows, path, stats=None):
+    """Write categorized job rows to a CSV as they arrive and return how many were written
+    
+    Rows are written in batches of 1000 and each batch is timed as the write stage of
+    stats when given. The file only replaces path once complete (see replacing).
+    """
+    if stats is None:
+        stats = PipelineStats()
+    count = 0
+    with replacing(path) as temp_path, open(temp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')  # QUOTE_ALL to handle commas in fields
+        writer.writerow(CSV_COLUMNS)
+        for batch in iter_chunks(rows, 1000):
+            with stats.stage('write') as record:
+                writer.writerows([row[column] for column in CSV_COLUMNS] for row in batch)
+                record['rows_in'] += len(batch)
+                record['rows_out'] += len(batch)
+            count += len(batch)
+    return count
+
+def write_jobs_jsonl(rows, path, stats=None):
+    """Write categorized job rows as JSON lines and return how many were written"""
+    if stats is None:
+        stats = PipelineStats()
+    count = 0
+    with replacing(path) as temp_path, open(temp_path, 'w', encoding='utf-8') as f:
+        for batch in iter_chunks(rows, 1000):
+            with stats.stage('write') as record:
+                f.writelines(json.dumps({column: row[column] for column in CSV_COLUMNS}, ensure_ascii=False) + '\n'
+                             for row in batch)
+                record['rows_in'] += len(batch)
+                record['rows_out'] += len(batch)
+            count += len(batch)
+    return count
+
+def write_jobs_columnar(rows, path, format='auto', stats=None):
+    """Write categorized job rows as a columnar file (see ColumnarJobWriter)"""
+    if stats is None:
+        stats = PipelineStats()
+    writer = ColumnarJobWriter(path, format)
+    for batch in iter_chunks(rows, 1000):
+        with stats.stage('write') as record:
+            for row in batch:
+                writer.add(row)
+            record['rows_in'] += len(batch)
+            record['rows_out'] += len(batch)
+    with stats.stage('write'):
+        writer.close()
+    return writer.length
+
+OUTPUT_FORMATS = ['csv', 'jsonl', 'arrow', 'npz']
+
+def output_format_for(path):
+    """Guess the output format from a file extension, defaulting to CSV"""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    return {'jsonl': 'jsonl', 'ndjson': 'jsonl', 'arrow': 'arrow', 'feather': 'arrow', 'npz': 'npz'}.get(extension, 'csv')
+
+def write_jobs(rows, path, format='csv', stats=None):
+    """Write categorized job rows in one of OUTPUT_FORMATS and return how many were written"""
+    if format == 'csv':
+        return write_jobs_csv(rows, path, stats)
+    if format == 'jsonl':
+        return write_jobs_jsonl(rows, path, stats)
+    if format in ('arrow', 'npz'):
+        return write_jobs_columnar(rows, path, format, stats)
+    raise ValueError(f"Unknown output format: {format}")
+
+# Columnar output: typed numeric columns and dictionary-encoded repeated strings
+NUMERIC_COLUMNS = ['salary_min', 'salary_max', 'days_ago', 'category_confidence']
+DICTIONARY_COLUMNS = ['company', 'location', 'salary', 'time_posted', 'tags', 'category']
+STRING_COLUMNS = ['title', 'matched_keywords']
+
+class _StringColumnBuilder:
+    """UTF-8 bytes plus int64 offsets, the same layout Arrow uses for large strings"""
+    
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('q', [0])
+    
+    def append(self, value):
+        self.data += value.encode('utf-8')
+        self.offsets.append(len(self.data))
+    
+    def arrays(self):
+        import numpy as np
+        return np.frombuffer(bytes(self.data), dtype=np.uint8), np.frombuffer(self.offsets, dtype=np.int64)
+
+class _DictionaryColumnBuilder:
+    """int32 codes into a table of distinct values, in order of first appearance"""
+    
+    def __init__(self):
+        self.codes = array('i')
+        self.index = {}
+        self._values = None
+    
+    def append(self, value):
+        self.codes.append(self.index.setdefault(value, len(self.index)))
+    
+    def value(self, code):
+        if self._values is None or len(self._values) != len(self.index):
+            self._values = list(self.index)
+        return self._values[code]
+
+class ColumnarJobWriter:
+    """Accumulate categorized rows in compact columns and write them as Arrow IPC or .npz
+    
+    format 'arrow' needs pyarrow; 'npz' only needs NumPy and writes an uncompressed
+    archive that load_jobs_columnar can memory-map; 'auto' picks Arrow when pyarrow is
+    installed.
+    """
+    
+    def __init__(self, path, format='auto'):
+        if format == 'auto':
+            format = 'arrow' if importlib.util.find_spec('pyarrow') else 'npz'
+        if format not in ('arrow', 'npz'):
+            raise ValueError(f"Unknown columnar format: {format}")
+        self.path = path
+        self.format = format
+        self.length = 0
+        self.numeric = {column: array('d') for column in NUMERIC_COLUMNS}
+        self.dictionary = {column: _DictionaryColumnBuilder() for column in DICTIONARY_COLUMNS}
+        self.strings = {column: _StringColumnBuilder() for column in STRING_COLUMNS}
+    
+    def add(self, row):
+        for column, values in self.numeric.items():
+            value = row[column]
+            values.append(float('nan') if value is None else value)
+        for column, builder in self.dictionary.items():
+            builder.append(row[column])
+        for column, builder in self.strings.items():
+            builder.append(row[column])
+        self.length += 1
+    
+    def close(self):
+        if self.format == 'arrow':
+            self._write_arrow()
+        else:
+            self._write_npz()
+    
+    def _write_arrow(self):
+        import numpy as np
+        import pyarrow as pa
+        
+        columns = {}
+        for column in CSV_COLUMNS:
+            if column in self.numeric:
+                columns[column] = pa.array(np.frombuffer(self.numeric[column], dtype=np.float64),
+                                           from_pandas=True)
+            elif column in self.dictionary:
+                builder = self.dictionary[column]
+                columns[column] = pa.DictionaryArray.from_arrays(
+                    pa.array(np.frombuffer(builder.codes, dtype=np.int32)),
+                    pa.array(list(builder.index), pa.large_string())
+                )
+            else:
+                data, offsets = self.strings[column].arrays()
+                columns[column] = pa.Array.from_buffers(
+                    pa.large_string(), self.length, [None, pa.py_buffer(offsets), pa.py_buffer(data)]
+                )
+        table = pa.table(columns)
+        with replacing(self.path) as temp_path, pa.OSFile(temp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    
+    def _write_npz(self):
+        import numpy as np
+        arrays = {'__schema__': np.frombuffer(json.dumps({
+            'version': 1,
+            'length': self.length,
+            'columns': [
+                {'name': column,
+                 'kind': 'numeric' if column in self.numeric else
+                         'dictionary' if column in self.dictionary else 'string'}
+                for column in CSV_COLUMNS
+            ]
+        }).encode('utf-8'), dtype=np.uint8)}
+        for column, values in self.numeric.items():
+            arrays[column] = np.frombuffer(values, dtype=np.float64)
+        for column, builder in self.dictionary.items():
+            values = _StringColumnBuilder()
+            for value in builder.index:
+                values.append(value)
+            arrays[f'{column}.codes'] = np.frombuffer(builder.codes, dtype=np.int32)
+            arrays[f'{column}.values.data'], arrays[f'{column}.values.offsets'] = values.arrays()
+        for column, builder in self.strings.items():
+            arrays[f'{column}.data'], arrays[f'{column}.offsets'] = builder.arrays()
+        
+        # A file object keeps np.savez from appending .npz to the path
+        with replacing(self.path) as temp_path, open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+
+class StringColumn:
+    """Read-only string column over UTF-8 bytes and offsets, decoded on access"""
+    
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]]).decode('utf-8')
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+class DictionaryColumn:
+    """Read-only dictionary-encoded column: int32 codes into a list of distinct values"""
+    
+    def __init__(self, codes, values):
+        self.codes = codes
+        self.values = values
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+    
+    def __iter__(self):
+        for code in self.codes:
+            yield self.values[code]
+
+class JobTable:
+    """Jobs held column-wise in memory, so repeated strings are only stored once
+    
+    Columns in DICTIONARY_COLUMNS are int32 codes into their distinct values and
+    NUMERIC_COLUMNS are float64 arrays (NaN when missing); titles and matched keywords
+    stay lists. The columns are those of the first job added, so the table holds parsed
+    jobs as well as categorized rows. Indexing and iteration give job dicts back.
+    """
+    
+    def __init__(self, jobs=()):
+        self.columns = []
+        self.length = 0
+        self._data = {}
+        self.extend(jobs)
+    
+    def _add_columns(self, job):
+        self.columns = list(job)
+        for column in self.columns:
+            if column in DICTIONARY_COLUMNS:
+                self._data[column] = _DictionaryColumnBuilder()
+            elif column in NUMERIC_COLUMNS:
+                self._data[column] = array('d')
+            else:
+                self._data[column] = []
+    
+    def append(self, job):
+        if not self.columns:
+            self._add_columns(job)
+        for column in self.columns:
+            values, value = self._data[column], job[column]
+            if column in NUMERIC_COLUMNS:
+                values.append(float('nan') if value is None else value)
+            else:
+                values.append(value)
+        self.length += 1
+    
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+    
+    def __len__(self):
+        return self.length
+    
+    def column(self, name):
+        """Values of one column in row order, None where a number is missing"""
+        values = self._data[name]
+        if isinstance(values, _DictionaryColumnBuilder):
+            distinct = list(values.index)
+            return [distinct[code] for code in values.codes]
+        if isinstance(values, array):
+            return [value if value == value else None for value in values]
+        return list(values)
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        job = {}
+        for column in self.columns:
+            values = self._data[column]
+            if isinstance(values, _DictionaryColumnBuilder):
+                job[column] = values.value(values.codes[index])
+            else:
+                value = values[index]
+                job[column] = None if value != value else value
+        return job
+    
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
+    
+    def to_frame(self):
+        """DataFrame of the jobs with categorical dtypes for the dictionary-encoded columns"""
+        import numpy as np
+        import pandas as pd
+        data = {}
+        for column in self.columns:
+            values = self._data[column]
+            if isinstance(values, _DictionaryColumnBuilder):
+                data[column] = pd.Categorical.from_codes(np.frombuffer(values.codes, dtype=np.int32),
+                                                         categories=list(values.index))
+            elif isinstance(values, array):
+                data[column] = np.frombuffer(values, dtype=np.float64)
+            else:
+                data[column] = values
+        return pd.DataFrame(data, columns=self.columns)
+
+def _memmap_npz(path):
+    """Memory-map every member of an uncompressed .npz archive without reading it"""
+    import zipfile
+    import numpy as np
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} has compressed members and cannot be memory-mapped")
+            # Skip the local file header to reach the .npy payload
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            name = info.filename[:-len('.npy')] if info.filename.endswith('.npy') else info.filename
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                                         order='F' if fortran_order else 'C')
+    return arrays
+
+def load_jobs_columnar(path):
+    """Open a columnar job file without copying it into memory
+    
+    Arrow IPC files come back as a memory-mapped pyarrow Table. .npz files come back as
+    {column: values}: float64 memmaps (NaN when missing) for numeric columns,
+    DictionaryColumn for dictionary-encoded ones and StringColumn for free text.
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(6)
+    if magic == b'ARROW1':
+        import pyarrow as pa
+        return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    
+    arrays = _memmap_npz(path)
+    schema = json.loads(bytes(arrays['__schema__']).decode('utf-8'))
+    columns = {}
+    for column in schema['columns']:
+        name = column['name']
+        if column['kind'] == 'numeric':
+            columns[name] = arrays[name]
+        elif column['kind'] == 'dictionary':
+            values = StringColumn(arrays[f'{name}.values.data'], arrays[f'{name}.values.offsets'])
+            columns[name] = DictionaryColumn(arrays[f'{name}.codes'], list(values))
+        else:
+            columns[name] = StringColumn(arrays[f'{name}.data'], arrays[f'{name}.offsets'])
+    return columns
+
+# Dashboard aggregates, precomputed with the same definitions as src/lib/data-utils.ts
+SUMMARY_VERSION = 1
+TECHNOLOGY_KEYWORDS = {
+    'React': ['react', 'reactjs', 'react.js'],
+    'Python': ['python'],
+    'JavaScript': ['javascript', 'js', 'node', 'nodejs'],
+    'Java': ['java'],
+    'PHP': ['php'],
+    'Angular': ['angular'],
+    'Vue': ['vue'],
+    'TypeScript': ['typescript', 'ts'],
+    'SQL': ['sql', 'mysql', 'postgresql'],
+    'AWS': ['aws', 'amazon web services'],
+    'Docker': ['docker'],
+    'Kubernetes': ['kubernetes', 'k8s'],
+    'DevOps': ['devops'],
+    'Data Science': ['machine learning', 'ml', 'ai', 'tensorflow', 'pytorch'],
+    'CSS/HTML': ['html', 'css', 'sass', 'scss', 'bootstrap']
+}
+
+def summary_path_for(csv_path):
+    """The aggregate summary lives next to the CSV: jobs.csv -> jobs.summary.json"""
+    return os.path.splitext(csv_path)[0] + '.summary.json'
+
+def rule_dictionary_path_for(output_path):
+    """Where the rule dictionary of an output file goes: next to it, as .rules.json"""
+    return os.path.splitext(output_path)[0] + '.rules.json'
+
+def write_rule_dictionary(rules, path):
+    """Write the rule dictionary (see CategoryRules.dictionary) resolving an output's rule keys"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(rules.dictionary(), f, ensure_ascii=False)
+    return path
+
+def duplicates_path_for(output_path):
+    """Where the near duplicates of an output file go: next to it, as .duplicates.json"""
+    return os.path.splitext(output_path)[0] + '.duplicates.json'
+
+def write_duplicates(near_duplicates, path):
+    """Write the near duplicates a JobDeduplicator dropped, one object per duplicate:
+    duplicate_of is the 0-based output row of the kept job it duplicates"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(near_duplicates, f, ensure_ascii=False, indent=1)
+    return path
+
+def compute_aggregates(csv_path):
+    """Compute the dashboard metrics, category stats, top opportunities and technology
+    insights for a categorized CSV, exactly as src/lib/data-utils.ts defines them"""
+    import numpy as np
+    import pandas as pd
+    
+    # Repeated text is read as categoricals, so each distinct value is stored once
+    text_columns = ['company', 'title', 'location', 'salary', 'time_posted', 'tags',
+                    'category', 'matched_keywords']
+    df = pd.read_csv(csv_path, dtype={column: str if column in STRING_COLUMNS else 'category'
+                                      for column in text_columns},
+                     keep_default_na=False, na_values={column: [''] for column in NUMERIC_COLUMNS})
+    # The API route trims every field when it parses the CSV
+    for column in text_columns:
+        if column in STRING_COLUMNS:
+            df[column] = df[column].str.strip()
+        else:
+            categories = df[column].cat.categories
+            stripped = categories.str.strip()
+            if not stripped.equals(categories):
+                df[column] = pd.Categorical(stripped.take(df[column].cat.codes))
+    
+    days_ago = df['days_ago']
+    easy_apply = df['tags'].str.lower().str.contains('easy apply', regex=False)
+    # days_ago is only counted when truthy, so 0 and missing never count as recent
+    posted = days_ago.notna() & (days_ago != 0)
+    recent = posted & (days_ago <= 7)
+    
+    metrics = {
+        'total_jobs': int(len(df)),
+        'unique_companies': int(df['company'].nunique()),
+        'easy_apply_jobs': int(easy_apply.sum()),
+        'recent_jobs': int(recent.sum())
+    }
+    
+    # Category stats, in order of first appearance like the TS object keys
+    groups = df.assign(recent=recent, easy_apply=easy_apply).groupby('category', sort=False)
+    paid = df.loc[df['salary_min'] > 0, ['category', 'salary_min']]
+    average_salary = paid.groupby('category', sort=False)['salary_min'].mean()
+    # Median_Salary is the upper median: sorted[floor(n / 2)]
+    paid = paid.sort_values(['category', 'salary_min'], kind='stable')
+    position = paid.groupby('category').cumcount()
+    size = paid.groupby('category')['salary_min'].transform('size')
+    median_salary = paid.loc[position == size // 2].set_index('category')['salary_min']
+    
+    category_stats = {}
+    for category, job_count, recent_jobs, easy_apply_count in zip(
+        groups.size().index, groups.size(), groups['recent'].sum(), groups['easy_apply'].sum()
+    ):
+        avg_salary = float(average_salary.get(category, 0))
+        category_stats[category] = {
+            'Job_Count': int(job_count),
+            'Avg_Salary': avg_salary,
+            'Avg_Max_Salary': avg_salary,
+            'Recent_Jobs': int(recent_jobs),
+            'Easy_Apply_Count': int(easy_apply_count),
+            'Median_Salary': float(median_salary.get(category, 0))
+        }
+    
+    # Opportunity scores, accumulated in the same order as the TS code
+    category_counts = df['category'].map(df['category'].value_counts()).to_numpy(dtype=np.float64)
+    salary_min = df['salary_min'].to_numpy(dtype=np.float64)
+    days = days_ago.to_numpy(dtype=np.float64)
+    has_days = posted.to_numpy()
+    score = np.zeros(len(df))
+    score += np.select(
+        [has_days & (days <= 1), has_days & (days <= 3), has_days & (days <= 7), has_days & (days <= 14)],
+        [20.0, 15.0, 10.0, 5.0], 0.0
+    )
+    score += np.where(easy_apply.to_numpy(), 15.0, 0.0)
+    paid_mask = ~np.isnan(salary_min) & (salary_min > 0)
+    score += np.where(paid_mask, np.minimum(np.where(paid_mask, salary_min, 0) / 1000, 20), 0.0)
+    if len(df):
+        score += category_counts / category_counts.max() * 10
+    
+    # Stable descending sort keeps ties in input order like Array.prototype.sort
+    top_opportunities = []
+    for rank, index in enumerate(np.argsort(-score, kind='stable')[:10], start=1):
+        job = df.iloc[index]
+        top_opportunities.append({
+            'rank': rank,
+            'company': job['company'],
+            'title': job['title'],
+            'category': job['category'],
+            # Math.round rounds halves up
+            'score': float(np.floor(score[index] * 10 + 0.5) / 10),
+            'days_ago': float(days[index]) if has_days[index] else 0
+        })
+    
+    # Each distinct title is searched once and counted as often as it occurs
+    title_counts = df['title'].str.lower().value_counts(sort=False)
+    titles = title_counts.index.to_series()
+    technology_counts = []
+    for technology, keywords in TECHNOLOGY_KEYWORDS.items():
+        count = sum(int(title_counts[titles.str.contains(keyword, regex=False).to_numpy()].sum())
+                    for keyword in keywords)
+        if count > 0:
+            technology_counts.append({'technology': technology, 'count': count})
+    technology_insights = sorted(technology_counts, key=lambda insight: -insight['count'])
+    
+    return {
+        'version': SUMMARY_VERSION,
+        'source': os.path.basename(csv_path),
+        'metrics': metrics,
+        'categoryStats': category_stats,
+        'topOpportunities': top_opportunities,
+        'technologyInsights': technology_insights
+    }
+
+def write_aggregates(csv_path, summary_path=None):
+    """Write the precomputed dashboard aggregates for a CSV as a versioned JSON summary"""
+    summary_path = summary_path or summary_path_for(csv_path)
+    summary = compute_aggregates(csv_path)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary_path
+
+def rescore_output(output_path, rules_path=RULES_PATH, index_path=None, summary_path=None):
+    """Apply a rule edit to a finished output through its title index (see TitleIndex)
+    
+    Only titles the edit can affect are re-scored; the output, the index, the rule
+    dictionary and, with summary_path, the aggregate summary are patched in place.
+    Returns row and title counts: rows, titles, rescored titles and patched rows.
+    """
+    index_path = index_path or index_path_for(output_path)
+    index = TitleIndex.load(index_path)
+    new_rules = load_rules(rules_path, index.typo_tolerance)
+    changed, rescored = {}, 0
+    if new_rules.fingerprint != index.fingerprint:
+        old_rules = CategoryRules(index.categories, index.typo_tolerance)
+        changed, rescored = index.rescore(old_rules, new_rules)
+    
+    patched = patch_jobs_output(output_path, index, changed) if changed else 0
+    index.save(index_path)
+    if not index.verbose:
+        write_rule_dictionary(new_rules, rule_dictionary_path_for(output_path))
+    if summary_path is not None and changed:
+        write_aggregates(output_path, summary_path)
+    return {'rows': len(index), 'titles': len(index.titles), 'rescored': rescored, 'patched': patched}
+
+def run_pipeline(inputs='remote-trainee-jobs.txt', output_path='complete_categorized_jobs.csv',
+                 categorizer=None, workers=1, chunk_size=2000, store_path=None,
+                 columnar_path=None, columnar_format='auto', summary_path=None, output_format='csv',
+                 rules_path=RULES_PATH, rule_dictionary_path=None, verbose_matches=False,
+                 dedupe='exact', index_path=None, duplicates_path=None):
+    """Stream raw dumps through fix, parse, extract and categorize straight into an output file
+    
+    inputs is a path or a list of paths ('-' for stdin) whose rows are written in the
+    order given, in one of OUTPUT_FORMATS. No intermediate fixed file is written and rows
+    never accumulate in memory. With
+    workers other than 1 the stages run in a process pool (None uses every core) and the
+    given categorizer is ignored, as each worker loads the rules of rules_path itself;
+    without a categorizer the in-process modes load them too. With store_path the
+    run is incremental and in-process: only blocks missing from that SQLite store are
+    processed. With columnar_path the rows are also written as a columnar file (see
+    ColumnarJobWriter) next to the output. With summary_path the dashboard aggregates are
+    precomputed from the finished CSV (see compute_aggregates). matched_keywords holds
+    rule keys, resolved by the rule dictionary written to rule_dictionary_path; with
+    verbose_matches the keywords themselves are written instead. dedupe is one of
+    DEDUPE_MODES (see JobDeduplicator): in-process, duplicates are dropped right after
+    parsing; with workers or a store, from the finished rows, keeping the same ones.
+    With duplicates_path the near duplicates dropped in 'near' mode are written there
+    (see write_duplicates). Returns the job total, per-category counts, the first rows for
+    reporting, the near duplicates and per-stage stats (see PipelineStats), with stage times summed
+    over workers in the process pool. With index_path a TitleIndex of the output is
+    saved there, so that rule edits can be applied later with rescore_output.
+    """
+    if summary_path is not None and output_format != 'csv':
+        raise ValueError("The aggregate summary is computed from CSV output")
+    category_counts = Counter()
+    examples = []
+    columnar = ColumnarJobWriter(columnar_path, columnar_format) if columnar_path else None
+    rules = categorizer.rules if categorizer is not None else load_rules(rules_path)
+    deduplicator = JobDeduplicator(dedupe)
+    index = TitleIndex(rules, verbose_matches, output_format) if index_path is not None else None
+    
+    def dedupe_rows(rows):
+        for chunk in iter_chunks(rows, chunk_size):
+            yield from deduplicator.filter(chunk, stats)
+    
+    def tally(rows):
+        for row in rows:
+            if index is not None:
+                index.add(row)
+            if verbose_matches:
+                row['matched_keywords'] = rules.expand_matches(row['matched_keywords'])
+            category_counts[row['category']] += 1
+            if len(examples) < 10:
+                examples.append(row)
+            if columnar is not None:
+                columnar.add(row)
+            yield row
+    
+    stats = PipelineStats()
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    store = None
+    incremental = None
+    if store_path is not None:
+        if categorizer is None:
+            categorizer = create_accurate_categorizer(rules_path=rules_path)
+        store = JobStore(store_path)
+        incremental = {}
+        rows = dedupe_rows(iter_categorized_jobs_incremental(inputs, store, categorizer, chunk_size,
+                                                             incremental, stats))
+    elif workers == 1:
+        if categorizer is None:
+            categorizer = create_accurate_categorizer(rules_path=rules_path)
+        rows = iter_categorized_blocks(inputs, categorizer, chunk_size, stats, deduplicator)
+    else:
+        categorizer = None
+        rows = dedupe_rows(iter_categorized_jobs_parallel(inputs, workers, chunk_size, stats, rules_path))
+    
+    try:
+        total = write_jobs(tally(rows), output_path, output_format, stats)
+    finally:
+        if store is not None:
+            store.close()
+    if columnar is not None:
+        with stats.stage('write'):
+            columnar.close()
+    if rule_dictionary_path is not None:
+        write_rule_dictionary(rules, rule_dictionary_path)
+    if index is not None:
+        index.save(index_path)
+    if duplicates_path is not None and dedupe == 'near':
+        write_duplicates(deduplicator.near_duplicates, duplicates_path)
+    if summary_path is not None:
+        with stats.stage('summary') as record:
+            write_aggregates(output_path, summary_path)
+            record['rows_in'] += total
+            record['rows_out'] += 1
+    
+    cache_info = categorizer.cache_info() if hasattr(categorizer, 'cache_info') else None
+    run_stats = dict(stats.as_dict(), wall_seconds=time.perf_counter() - start_wall,
+                     cpu_seconds=time.process_time() - start_cpu, peak_rss_mb=peak_rss_mb())
+    return {'total': total, 'category_counts': category_counts, 'examples': examples,
+            'cache': cache_info, 'incremental': incremental, 'duplicates': deduplicator.near_duplicates,
+            'stats': run_stats}
+
+def int_at_least(minimum):
+    """argparse type for integers of at least minimum"""
+    def parse(value):
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    parse.__name__ = 'int'  # named in argparse's "invalid int value" message
+    return parse
+
+def main(argv=None):
+    """Main function to fix titles and categorize jobs"""
+    
+    parser = argparse.ArgumentParser(description="Fix, parse and categorize LinkedIn job dumps")
+    parser.add_argument('inputs', nargs='*',
+                        help="dump files or globs, merged in the order given; - reads stdin "
+                             "(default: remote-trainee-jobs.txt); titles with --titles")
+    parser.add_argument('--titles', action='store_true',
+                        help="only categorize the titles given as arguments, or one per line on "
+                             "stdin, and print them as JSON lines")
+    parser.add_argument('-o', '--output', default='complete_categorized_jobs.csv',
+                        help="output file (default: complete_categorized_jobs.csv)")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                        help="output format (default: from the output extension, else csv)")
+    parser.add_argument('--rules', metavar='PATH', default=RULES_PATH,
+                        help="category rule file (default: category_rules.json)")
+    parser.add_argument('--workers', type=int_at_least(0), default=1,
+                        help="worker processes; 1 runs in-process, 0 uses every core (default: 1)")
+    parser.add_argument('--chunk-size', type=int_at_least(1), default=2000,
+                        help="job blocks per worker task or store lookup (default: 2000)")
+    parser.add_argument('--store', metavar='PATH',
+                        help="SQLite store for incremental runs; only new or changed blocks are processed")
+    parser.add_argument('--columnar', metavar='PATH',
+                        help="also write a columnar copy of the output (Arrow IPC, or .npz without pyarrow)")
+    parser.add_argument('--columnar-format', choices=['auto', 'arrow', 'npz'], default='auto',
+                        help="columnar file format (default: arrow when pyarrow is installed)")
+    parser.add_argument('--dedupe', choices=DEDUPE_MODES, default='exact',
+                        help="drop exact duplicate postings (exact, the default), also near "
+                             "duplicate titles of one company (near), or nothing (none)")
+    parser.add_argument('--index', action='store_true',
+                        help="also save a title index next to the output (.index.pickle) for --rescore")
+    parser.add_argument('--rescore', action='store_true',
+                        help="after a rule edit, re-score only the affected titles of an output "
+                             "written with --index and patch it in place")
+    parser.add_argument('--verbose-matches', action='store_true',
+                        help="write matched keywords instead of rule keys, with no rule dictionary")
+    parser.add_argument('--no-summary', action='store_true',
+                        help="skip writing the precomputed dashboard aggregates next to a CSV output")
+    parser.add_argument('--stats', metavar='PATH',
+                        help="write per-stage timings, row counts and peak memory as JSON")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="run under cProfile and dump the profile stats to PATH")
+    args = parser.parse_args(argv)
+    
+    if args.titles:
+        titles = args.inputs or (line.rstrip('\r\n') for line in sys.stdin)
+        categorizer = create_accurate_categorizer(rules_path=args.rules)
+        for row in categorize_titles(titles, categorizer, args.verbose_matches):
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + '\n')
+        return None
+    
+    if args.rescore:
+        output_format = args.format or output_format_for(args.output)
+        summary_path = None
+        if output_format == 'csv' and not args.no_summary:
+            summary_path = summary_path_for(args.output)
+        print(f"🔁 Re-scoring {args.output} with the rules of {args.rules}...")
+        start = time.perf_counter()
+        try:
+            result = rescore_output(args.output, args.rules, summary_path=summary_path)
+        except (FileNotFoundError, ValueError) as error:
+            parser.error(str(error))
+        print(f"✅ Re-scored {result['rescored']} of {result['titles']} distinct titles and patched "
+              f"{result['patched']} of {result['rows']} rows in {time.perf_counter() - start:.2f}s")
+        return result
+    
+    try:
+        inputs = expand_inputs(args.inputs or ['remote-trainee-jobs.txt'])
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    output_format = args.format or output_format_for(args.output)
+    summary_path = None
+    if output_format == 'csv' and not args.no_summary:
+        summary_path = summary_path_for(args.output)
+    rule_dictionary_path = None if args.verbose_matches else rule_dictionary_path_for(args.output)
+    
+    print("🚀 Starting complete job data fix and categorization...")
+    print(f"🔄 Fixing, parsing, extracting and categorizing jobs from {len(inputs)} input(s)...")
+    
+    pipeline_args = dict(inputs=inputs, output_path=args.output, output_format=output_format,
+                         workers=args.workers or None, chunk_size=args.chunk_size,
+                         store_path=args.store, columnar_path=args.columnar,
+                         columnar_format=args.columnar_format, summary_path=summary_path,
+                         rules_path=args.rules, verbose_matches=args.verbose_matches,
+                         rule_dictionary_path=rule_dictionary_path, dedupe=args.dedupe,
+                         index_path=index_path_for(args.output) if args.index else None,
+                         duplicates_path=duplicates_path_for(args.output))
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        summary = profiler.runcall(run_pipeline, **pipeline_args)
+        profiler.dump_stats(args.profile)
+    else:
+        summary = run_pipeline(**pipeline_args)
+    total = summary['total']
     
     # Print statistics
     print(f"✅ Complete fix and categorization finished!")
-    print(f"📊 Total jobs: {len(df)}")
+    print(f"📊 Total jobs: {total} written to {args.output} ({output_format})")
     
-    category_counts = df['category'].value_counts()
     print(f"📈 Category distribution:")
-    for category, count in category_counts.items():
-        percentage = (count / len(df)) * 100
+    for category, count in summary['category_counts'].most_common():
+        percentage = (count / total) * 100
         print(f"   {category}: {count} jobs ({percentage:.1f}%)")
     
+    incremental = summary['incremental']
+    if incremental is not None:
+        print(f"♻️ Incremental run: {incremental['parsed']} blocks parsed, "
+              f"{incremental['recategorized']} re-categorized, {incremental['reused']} reused")
+    
+    counters = summary['stats']['counters']
+    if args.dedupe != 'none':
+        collapsed = counters.get('duplicates_exact', 0) + counters.get('duplicates_near', 0)
+        print(f"🧹 Collapsed {collapsed} duplicate rows: {counters.get('duplicates_exact', 0)} exact, "
+              f"{counters.get('duplicates_near', 0)} near")
+    if args.dedupe == 'near':
+        for duplicate in summary['duplicates'][:5]:
+            print(f"   ~{duplicate['similarity']:.0%} at {duplicate['company']}: "
+                  f"{duplicate['title']!r} duplicates row {duplicate['duplicate_of']}")
+        print(f"👯 Near duplicates and the rows they duplicate written to "
+              f"{duplicates_path_for(args.output)}")
+    
+    cache_info = summary['cache']
+    if cache_info and cache_info['hits'] + cache_info['misses']:
+        hit_rate = cache_info['hits'] / (cache_info['hits'] + cache_info['misses']) * 100
+        print(f"🧠 Categorization cache: {cache_info['hits']} hits, {cache_info['misses']} misses "
+              f"({hit_rate:.1f}% hit rate), {cache_info['evictions']} evictions")
+    
+    if summary_path is not None:
+        print(f"🧮 Dashboard aggregates written to {summary_path}")
+    if args.index:
+        print(f"📇 Title index for --rescore written to {index_path_for(args.output)}")
+    if rule_dictionary_path is not None:
+        print(f"🗂️ Rule dictionary for matched_keywords written to {rule_dictionary_path}")
+    
+    stats = summary['stats']
+    print(f"⏱️ Stages ({stats['wall_seconds']:.2f}s wall, {stats['cpu_seconds']:.2f}s CPU, "
+          f"peak RSS {stats['peak_rss_mb'] or 0:.0f} MB):")
+    for stage, record in stats['stages'].items():
+        print(f"   {stage}: {record['wall_seconds']:.3f}s wall, {record['cpu_seconds']:.3f}s CPU, "
+              f"{record['rows_in']} -> {record['rows_out']} rows")
+    print(f"   skipped {counters.get('blocks_skipped_short', 0)} short and "
+          f"{counters.get('blocks_skipped_incomplete', 0)} incomplete blocks; "
+          f"{counters.get('missing_salary', 0)} jobs without salary, "
+          f"{counters.get('missing_days_ago', 0)} without posting age")
+    if args.stats:
+        with open(args.stats, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+        print(f"💾 Stage stats written to {args.stats}")
+    if args.profile:
+        import pstats
+        print(f"🔬 Profile written to {args.profile} (top functions by cumulative time):")
+        pstats.Stats(args.profile).sort_stats('cumulative').print_stats(15)
+    
     # Show examples of fixed titles
     print(f"\n🔍 Examples of fixed titles:")
-    for i, row in df.head(10).iterrows():
+    for row in summary['examples']:
         print(f"   {row['title']} -> {row['category']} (confidence: {row['category_confidence']:.0f}%)")
     
-    return df
+    return summary
 
 if __name__ == "__main__":
     main()
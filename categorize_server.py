@@ -0,0 +1,315 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qs
+
+from categorize_jobs import (
+    CSV_COLUMNS, DEDUPE_MODES, RULES_PATH, JobDeduplicator, PipelineStats, categorize_stage,
+    create_accurate_categorizer, extract_stage, fix_blocks, parse_blocks
+)
+from query_jobs import JobQueryIndex, query_from_params
+
+MAX_BODY_BYTES = 16 << 20
+TITLE_COLUMNS = ['title', 'category', 'category_confidence', 'matched_keywords']
+
+def split_dump_text(text):
+    """Job blocks of a raw dump held in a string, split like a dump file read in text mode"""
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n\n')
+
+def parse_request(payload):
+    """(kind, items, verbose) out of a /categorize JSON body: kind is 'blocks' or 'titles'"""
+    if not isinstance(payload, dict):
+        raise ValueError("Expected a JSON object")
+    if 'text' in payload:
+        if not isinstance(payload['text'], str):
+            raise ValueError("'text' must be a string")
+        items, kind = split_dump_text(payload['text']), 'blocks'
+    elif 'blocks' in payload:
+        items, kind = payload['blocks'], 'blocks'
+    elif 'titles' in payload:
+        items, kind = payload['titles'], 'titles'
+    else:
+        raise ValueError("Expected one of 'text', 'blocks' or 'titles'")
+    if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+        raise ValueError(f"'{kind}' must be a list of strings")
+    verbose = payload.get('verbose', False)
+    if not isinstance(verbose, bool):
+        raise ValueError("'verbose' must be true or false")
+    return kind, items, verbose
+
+class BatchProcessor:
+    """Categorizer kept warm behind a queue that merges concurrent requests into batches
+
+    Requests waiting at the same time are processed together, up to max_batch items
+    or max_delay seconds after the first one, so extraction and categorization run in
+    one columnar batch. Batches run one at a time in a worker thread, which keeps the
+    event loop free to accept and read other requests meanwhile. Duplicate postings
+    within one request are dropped in the dedupe mode (see JobDeduplicator), as the
+    pipeline does for one run.
+    """
+
+    def __init__(self, categorizer, max_batch=2000, max_delay=0.005, dedupe='exact'):
+        if dedupe not in DEDUPE_MODES:
+            raise ValueError(f"Unknown dedupe mode {dedupe!r}; expected one of {DEDUPE_MODES}")
+        self.categorizer = categorizer
+        self.dedupe = dedupe
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = PipelineStats()
+        self.requests = 0
+        self.batches = 0
+        self.items = 0
+        self._queue = asyncio.Queue()
+
+    async def submit(self, kind, items, verbose=False):
+        """Rows for the blocks or titles of one request, once its batch has run"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((kind, items, verbose, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][1])
+            deadline = loop.time() + self.max_delay
+            while size < self.max_batch:
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                batch.append(request)
+                size += len(request[1])
+
+            try:
+                results = await loop.run_in_executor(None, self._process, batch)
+            except Exception as error:
+                for *_request, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (*_request, future), rows in zip(batch, results):
+                if not future.done():
+                    future.set_result(rows)
+            self.requests += len(batch)
+            self.batches += 1
+            self.items += size
+
+    def _process(self, batch):
+        """Fix, parse and dedupe each request's blocks, then extract and categorize all jobs
+        at once"""
+        per_request = []
+        for kind, items, _verbose, _future in batch:
+            if kind == 'blocks':
+                jobs = parse_blocks(fix_blocks(items, self.stats), self.stats)
+                jobs = [job for job in jobs if job is not None]
+                per_request.append(JobDeduplicator(self.dedupe).filter(jobs, self.stats))
+            else:
+                per_request.append([{'title': title} for title in items])
+
+        extract_stage([job for (kind, *_request), jobs in zip(batch, per_request)
+                       if kind == 'blocks' for job in jobs], self.stats)
+        categorize_stage([job for jobs in per_request for job in jobs], self.categorizer, self.stats)
+
+        results = []
+        expand_matches = self.categorizer.rules.expand_matches
+        for (kind, _items, verbose, _future), jobs in zip(batch, per_request):
+            if verbose:
+                for job in jobs:
+                    job['matched_keywords'] = expand_matches(job['matched_keywords'])
+            columns = CSV_COLUMNS if kind == 'blocks' else TITLE_COLUMNS
+            results.append([{column: job[column] for column in columns} for job in jobs])
+        return results
+
+    def info(self):
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'items': self.items,
+            'pending': self._queue.qsize(),
+            'cache': self.categorizer.cache_info(),
+            'stats': self.stats.as_dict()
+        }
+
+class CategorizationServer:
+    """Minimal HTTP/1.1 server (keep-alive, JSON only) in front of a BatchProcessor
+
+    GET /health reports the rules fingerprint, GET /stats the batching and stage
+    counters, GET /rules the rule dictionary resolving matched rule keys, GET /jobs
+    queries the jobs_path output (see query_from_params for the parameters), and POST
+    /categorize takes {"text": raw dump}, {"blocks": [...]} or {"titles": [...]} and
+    returns {"jobs": [...]}: parsed jobs with salary, posting age and category columns,
+    or only the category columns for titles. "verbose": true writes matched keywords
+    instead of rule keys. At most max_concurrency requests are handled at once; others
+    wait for a slot. A request that fails unexpectedly is answered with 500 and
+    {"error": ...}.
+    """
+
+    def __init__(self, processor, max_concurrency=8, jobs_path=None):
+        self.processor = processor
+        self.started = time.time()
+        self.jobs_path = jobs_path
+        self._jobs = None
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    def jobs(self):
+        """Query index of jobs_path, rebuilt whenever the file has been rewritten; while the
+        file is missing or unreadable the last index built is kept, else OSError is raised"""
+        try:
+            if self._jobs is None or self._jobs.mtime != os.path.getmtime(self.jobs_path):
+                self._jobs = JobQueryIndex.from_output(self.jobs_path)
+        except OSError:
+            if self._jobs is None:
+                raise
+        return self._jobs
+
+    def query_jobs(self, params):
+        return self.jobs().query(**query_from_params(params))
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _version = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                       {'error': f"Body larger than {MAX_BODY_BYTES} bytes"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                async with self._slots:
+                    try:
+                        status, payload = await self.route(method, target, body)
+                    except Exception as error:
+                        # A failed request gets an answer instead of a dropped connection
+                        status, payload = (HTTPStatus.INTERNAL_SERVER_ERROR,
+                                           {'error': f"{type(error).__name__}: {error}"})
+                close = headers.get('connection', '').lower() == 'close'
+                await self.respond(writer, status, payload, close)
+                if close:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, target, body):
+        path, _, query = target.partition('?')
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, {'status': 'ok', 'rules': self.processor.categorizer.rules.fingerprint,
+                                   'uptime_seconds': time.time() - self.started}
+        if path == '/stats' and method == 'GET':
+            return HTTPStatus.OK, self.processor.info()
+        if path == '/rules' and method == 'GET':
+            return HTTPStatus.OK, self.processor.categorizer.rules.dictionary()
+        if path == '/jobs' and method == 'GET':
+            if self.jobs_path is None:
+                return HTTPStatus.NOT_FOUND, {'error': "No job output to query; start the server with --jobs"}
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, self.query_jobs, parse_qs(query, keep_blank_values=False)
+                )
+            except ValueError as error:
+                return HTTPStatus.BAD_REQUEST, {'error': str(error)}
+            except OSError as error:
+                return HTTPStatus.SERVICE_UNAVAILABLE, {'error': f"Cannot read job output {self.jobs_path}: "
+                                                                 f"{error.strerror or error}"}
+            return HTTPStatus.OK, result
+        if path == '/categorize':
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': "Use POST"}
+            try:
+                kind, items, verbose = parse_request(json.loads(body or b'null'))
+            except ValueError as error:
+                return HTTPStatus.BAD_REQUEST, {'error': str(error)}
+            jobs = await self.processor.submit(kind, items, verbose)
+            return HTTPStatus.OK, {'jobs': jobs, 'count': len(jobs)}
+        return HTTPStatus.NOT_FOUND, {'error': f"No route for {method} {path}"}
+
+    async def respond(self, writer, status, payload, close=False):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+async def serve(host='127.0.0.1', port=8765, socket_path=None, rules_path=RULES_PATH,
+                max_batch=2000, max_delay=0.005, max_concurrency=8, ready=None, jobs_path=None,
+                dedupe='exact'):
+    """Run the categorization server until cancelled; ready(address) is called once listening"""
+    processor = BatchProcessor(create_accurate_categorizer(rules_path=rules_path), max_batch, max_delay,
+                               dedupe)
+    # Warm up the lazily imported batch stages before the first request
+    processor._process([('blocks', [], False, None)])
+    server = CategorizationServer(processor, max_concurrency, jobs_path)
+    if jobs_path is not None:
+        try:
+            server.jobs()
+        except OSError:
+            pass  # /jobs answers 503 until the output exists
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        listener = await asyncio.start_unix_server(server.handle_connection, path=socket_path)
+        address = socket_path
+    else:
+        listener = await asyncio.start_server(server.handle_connection, host, port)
+        address = 'http://%s:%d' % listener.sockets[0].getsockname()[:2]
+    if ready is not None:
+        ready(address)
+
+    batcher = asyncio.create_task(processor.run())
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        batcher.cancel()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the job categorizer warm over localhost HTTP or a Unix socket")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument('--socket', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--rules', default=RULES_PATH, help="category rule file (default: category_rules.json)")
+    parser.add_argument('--max-batch', type=int, default=2000,
+                        help="blocks or titles merged into one batch at most (default: 2000)")
+    parser.add_argument('--max-delay-ms', type=float, default=5.0,
+                        help="how long a batch waits for more requests (default: 5)")
+    parser.add_argument('--max-concurrency', type=int, default=8,
+                        help="requests handled at once; others wait (default: 8)")
+    parser.add_argument('--jobs', metavar='PATH',
+                        help="pipeline output to serve queries over on GET /jobs, e.g. complete_categorized_jobs.csv")
+    parser.add_argument('--dedupe', choices=DEDUPE_MODES, default='exact',
+                        help="duplicate postings of a request to drop, as in categorize_jobs.py (default: exact)")
+    args = parser.parse_args(argv)
+
+    print("🚀 Starting categorization server...")
+    try:
+        asyncio.run(serve(args.host, args.port, args.socket, args.rules, args.max_batch,
+                          args.max_delay_ms / 1000, args.max_concurrency,
+                          ready=lambda address: print(f"👂 Listening on {address}", flush=True),
+                          jobs_path=args.jobs, dedupe=args.dedupe))
+    except KeyboardInterrupt:
+        print("👋 Server stopped")
+
+if __name__ == "__main__":
+    main()
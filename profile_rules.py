@@ -0,0 +1,52 @@
+import argparse
+import csv
+from collections import Counter
+
+from categorize_jobs import RULES_PATH, iter_jobs, load_rules, profile_rules
+
+SORT_KEYS = ['hits', 'wins', 'evaluations', 'seconds', 'category', 'kind', 'label', 'status']
+
+def iter_titles(path):
+    """Titles of a categorized CSV (title column) or of a raw LinkedIn dump"""
+    if path.endswith('.csv'):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row['title']
+    else:
+        for job in iter_jobs(path):
+            yield job['title']
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count hits and time per categorization rule over a corpus")
+    parser.add_argument('inputs', nargs='*', default=['remote-trainee-jobs.txt'],
+                        help="raw dumps or categorized CSVs (default: remote-trainee-jobs.txt)")
+    parser.add_argument('--rules', default=RULES_PATH, help="category rule file (default: category_rules.json)")
+    parser.add_argument('--sort', choices=SORT_KEYS, default='hits', help="report order (default: hits)")
+    parser.add_argument('--output', default='rule_profile.csv', help="CSV report of every rule")
+    parser.add_argument('--top', type=int, default=20, help="rules to print (default: 20)")
+    args = parser.parse_args(argv)
+
+    print("🔬 Tracing categorization rules...")
+    profile = profile_rules((title for path in args.inputs for title in iter_titles(path)),
+                            load_rules(args.rules))
+    profile.write_report(args.output, args.sort)
+    rows = profile.report(args.sort)
+
+    statuses = Counter(row['status'] for row in rows)
+    print(f"📊 {profile.titles} titles, {len(rows)} rules and exclusions: "
+          f"{statuses['winning']} winning, {statuses['losing']} only in losing categories, "
+          f"{statuses['active']} active exclusions, {statuses['dead']} dead")
+    print("⏱️ Stage time: " + ', '.join(f"{stage} {seconds:.3f}s" for stage, seconds in profile.stage_seconds.items()))
+
+    print(f"\n   {'hits':>6} {'wins':>6} {'evals':>6} {'ms':>8}  {'status':<8} {'kind':<10} {'category':<24} label")
+    for row in rows[:args.top]:
+        milliseconds = f"{row['seconds'] * 1000:8.2f}" if row['seconds'] is not None else f"{'':>8}"
+        print(f"   {row['hits']:>6} {row['wins'] if row['wins'] is not None else '':>6} "
+              f"{row['evaluations'] if row['evaluations'] is not None else '':>6} {milliseconds}  "
+              f"{row['status']:<8} {row['kind']:<10} {row['category']:<24} {row['label'][:60]}")
+    print(f"\n💾 Full report written to {args.output}")
+
+    return profile
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+import argparse
+import json
+import os
+
+from categorize_jobs import (
+    CSV_COLUMNS, NUMERIC_COLUMNS, STRING_COLUMNS, load_jobs_columnar, normalize_title, output_format_for
+)
+
+HASH_COLUMNS = ['category', 'company']
+SORT_COLUMNS = NUMERIC_COLUMNS
+DEFAULT_LIMIT = 20
+QUERY_PARAMETERS = ['category', 'company', 'keyword', *NUMERIC_COLUMNS, 'sort', 'order', 'offset', 'limit']
+MAX_LIMIT = 1000
+# Below this share of all rows a sorted page is taken by sorting the matches themselves
+SUBSET_SORT_SHARE = 1 / 16
+WALK_CHUNK = 8192
+
+def load_jobs_frame(path, format=None):
+    """DataFrame of a pipeline output (csv, jsonl, arrow or npz) with categorical text columns"""
+    import pandas as pd
+    format = format or output_format_for(path)
+    if format == 'csv':
+        text_columns = [column for column in CSV_COLUMNS if column not in NUMERIC_COLUMNS]
+        return pd.read_csv(path, dtype={column: str if column in STRING_COLUMNS else 'category'
+                                        for column in text_columns},
+                           keep_default_na=False, na_values={column: [''] for column in NUMERIC_COLUMNS})
+    if format == 'jsonl':
+        df = pd.read_json(path, lines=True, dtype=False)
+        if df.empty:
+            df = pd.DataFrame(columns=CSV_COLUMNS)
+        for column in CSV_COLUMNS:
+            if column in NUMERIC_COLUMNS:
+                df[column] = df[column].astype('float64')
+            elif column not in STRING_COLUMNS:
+                df[column] = df[column].astype('category')
+        return df
+
+    columns = load_jobs_columnar(path)
+    if not isinstance(columns, dict):
+        return columns.to_pandas()
+    data = {}
+    for column in CSV_COLUMNS:
+        values = columns[column]
+        if hasattr(values, 'codes'):
+            data[column] = pd.Categorical.from_codes(values.codes, categories=values.values)
+        elif column in NUMERIC_COLUMNS:
+            data[column] = values
+        else:
+            data[column] = list(values)
+    return pd.DataFrame(data, columns=CSV_COLUMNS)
+
+class Postings:
+    """Sorted row ids of every distinct value of a dictionary-encoded column"""
+
+    def __init__(self, codes, values):
+        import numpy as np
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.values = list(values)
+        self.ids = {value: code for code, value in enumerate(self.values)}
+        counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.values))
+        self.bounds = np.concatenate(([0], np.cumsum(counts)))
+        self.order = np.argsort(self.codes, kind='stable').astype(np.int64)[int((self.codes < 0).sum()):]
+
+    def lookup(self, values):
+        """Codes of the values present in the column"""
+        return sorted({self.ids[value] for value in values if value in self.ids})
+
+    def size(self, codes):
+        return int(sum(self.bounds[code + 1] - self.bounds[code] for code in codes))
+
+    def rows(self, codes):
+        import numpy as np
+        parts = [self.order[self.bounds[code]:self.bounds[code + 1]] for code in codes]
+        if len(parts) == 1:
+            return parts[0]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+    def contains(self, rows, codes):
+        import numpy as np
+        return np.isin(self.codes[rows], codes)
+
+class RangeIndex:
+    """Row ids of a numeric column sorted by value, searched by bisection for ranges
+
+    Missing values (NaN) are left out of the sorted order and never match a range;
+    sorted pages list them last. Ties keep row order in both directions.
+    """
+
+    def __init__(self, values):
+        import numpy as np
+        self.values = np.asarray(values, dtype=np.float64)
+        missing = np.isnan(self.values)
+        present = np.flatnonzero(~missing)
+        self.order = present[np.argsort(self.values[present], kind='stable')]
+        self.sorted = self.values[self.order]
+        self.missing = np.flatnonzero(missing)
+        self._descending = None
+
+    def bounds(self, low, high):
+        import numpy as np
+        start = 0 if low is None else int(np.searchsorted(self.sorted, low, 'left'))
+        stop = len(self.sorted) if high is None else int(np.searchsorted(self.sorted, high, 'right'))
+        return start, max(start, stop)
+
+    def size(self, low, high):
+        start, stop = self.bounds(low, high)
+        return stop - start
+
+    def rows(self, low, high):
+        import numpy as np
+        start, stop = self.bounds(low, high)
+        return np.sort(self.order[start:stop])
+
+    def contains(self, rows, low, high):
+        values = self.values[rows]
+        mask = values == values
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def descending(self):
+        """Row ids by decreasing value, ties in row order"""
+        import numpy as np
+        if self._descending is None:
+            present = np.flatnonzero(~np.isnan(self.values))
+            self._descending = present[np.argsort(-self.values[present], kind='stable')]
+        return self._descending
+
+class JobQueryIndex:
+    """Indexes over a categorized job output for filtered, sorted and paginated queries
+
+    category and company are hash indexes (posting lists of row ids), every numeric
+    column a RangeIndex and title keywords an inverted index from normalized title
+    words to the distinct titles containing them. A query materializes only its most
+    selective filter and checks the others on those rows, so it never scans every job
+    unless a filter matches most of them.
+    """
+
+    def __init__(self, df, path=None):
+        import numpy as np
+        import pandas as pd
+        self.df = df.reset_index(drop=True)
+        self.path = path
+        self.mtime = os.path.getmtime(path) if path else None
+        self.length = len(self.df)
+
+        self.hashes = {}
+        for column in HASH_COLUMNS:
+            values = self.df[column]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype('category')
+            self.hashes[column] = Postings(values.cat.codes.to_numpy(), values.cat.categories)
+        self.ranges = {column: RangeIndex(self.df[column].to_numpy(dtype=np.float64))
+                       for column in NUMERIC_COLUMNS}
+
+        title_codes, titles = pd.factorize(self.df['title'].fillna(''), sort=False)
+        self.titles = Postings(title_codes, range(len(titles)))
+        self.words = {}   # normalized title word -> ids of the distinct titles containing it
+        for title_id, title in enumerate(titles):
+            for word in set(normalize_title(title).split()):
+                self.words.setdefault(word, []).append(title_id)
+
+    @classmethod
+    def from_output(cls, path, format=None):
+        return cls(load_jobs_frame(path, format), path)
+
+    def _keyword_titles(self, keywords):
+        """Ids of the distinct titles containing every word of the keywords"""
+        words = [word for keyword in keywords for word in normalize_title(keyword).split()]
+        title_ids = None
+        for word in sorted(set(words), key=lambda word: len(self.words.get(word, ()))):
+            found = self.words.get(word, ())
+            title_ids = set(found) if title_ids is None else title_ids.intersection(found)
+            if not title_ids:
+                break
+        return sorted(title_ids or ())
+
+    def _filters(self, category=None, company=None, keywords=None, ranges=None):
+        """(estimated rows, rows(), contains(rows)) for every filter given"""
+        filters = []
+        for column, values in (('category', category), ('company', company)):
+            if values:
+                postings = self.hashes[column]
+                codes = postings.lookup([values] if isinstance(values, str) else values)
+                filters.append((postings.size(codes), lambda postings=postings, codes=codes: postings.rows(codes),
+                                lambda rows, postings=postings, codes=codes: postings.contains(rows, codes)))
+        if keywords:
+            title_ids = self._keyword_titles([keywords] if isinstance(keywords, str) else keywords)
+            filters.append((self.titles.size(title_ids), lambda: self.titles.rows(title_ids),
+                            lambda rows: self.titles.contains(rows, title_ids)))
+        for column, (low, high) in (ranges or {}).items():
+            if column not in self.ranges:
+                raise ValueError(f"No range index on {column!r}; expected one of {NUMERIC_COLUMNS}")
+            if low is None and high is None:
+                continue
+            index = self.ranges[column]
+            filters.append((index.size(low, high), lambda index=index, low=low, high=high: index.rows(low, high),
+                            lambda rows, index=index, low=low, high=high: index.contains(rows, low, high)))
+        return filters
+
+    def match(self, category=None, company=None, keywords=None, ranges=None):
+        """Sorted ids of the rows matching every filter, or None when nothing is filtered"""
+        filters = sorted(self._filters(category, company, keywords, ranges), key=lambda item: item[0])
+        if not filters:
+            return None
+        rows = filters[0][1]()
+        for _size, _rows, contains in filters[1:]:
+            if not len(rows):
+                break
+            rows = rows[contains(rows)]
+        return rows
+
+    def _page(self, rows, sort, descending, offset, limit):
+        """Row ids of one page of the matches in sort order"""
+        import numpy as np
+        if sort is None:
+            if rows is None:
+                return np.arange(min(offset, self.length), min(offset + limit, self.length))
+            return rows[offset:offset + limit]
+        if sort not in self.ranges:
+            raise ValueError(f"Cannot sort by {sort!r}; expected one of {SORT_COLUMNS}")
+        index = self.ranges[sort]
+        ordered = index.descending() if descending else index.order
+
+        if rows is None:
+            head = ordered[offset:offset + limit]
+            rest = index.missing[max(0, offset - len(ordered)):max(0, offset + limit - len(ordered))]
+            return np.concatenate((head, rest))
+        if len(rows) <= self.length * SUBSET_SORT_SHARE:
+            values = index.values[rows]
+            present = ~np.isnan(values)
+            keys = -values[present] if descending else values[present]
+            ranked = np.concatenate((rows[present][np.argsort(keys, kind='stable')], rows[~present]))
+            return ranked[offset:offset + limit]
+
+        # Many matches: walk the sorted index and stop once the page is complete
+        needed = offset + limit
+        found = []
+        count = 0
+        for sequence in (ordered, index.missing):
+            for start in range(0, len(sequence), WALK_CHUNK):
+                chunk = sequence[start:start + WALK_CHUNK]
+                positions = np.minimum(np.searchsorted(rows, chunk), len(rows) - 1)
+                members = chunk[rows[positions] == chunk]
+                found.append(members)
+                count += len(members)
+                if count >= needed:
+                    break
+            if count >= needed:
+                break
+        ranked = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+        return ranked[offset:offset + limit]
+
+    def query(self, category=None, company=None, keywords=None, ranges=None, sort=None,
+              descending=False, offset=0, limit=DEFAULT_LIMIT):
+        """One page of the jobs matching every filter: {'total', 'offset', 'limit', 'jobs'}
+
+        category and company take a value or a list of values (any of them matches),
+        keywords a string or list whose words must all be title words, and ranges
+        {numeric column: (low, high)} with inclusive bounds, None leaving a side open.
+        sort is a numeric column (default: output order).
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        rows = self.match(category, company, keywords, ranges)
+        page = self._page(rows, sort, descending, offset, limit)
+        jobs = []
+        for job in self.df.iloc[page].to_dict('records'):
+            for column in NUMERIC_COLUMNS:
+                if job[column] != job[column]:
+                    job[column] = None
+            jobs.append({column: job[column] for column in CSV_COLUMNS})
+        return {'total': self.length if rows is None else int(len(rows)),
+                'offset': offset, 'limit': limit, 'jobs': jobs}
+
+def parse_range(text):
+    """(low, high) of a 'low:high' range; either side may be empty"""
+    low, separator, high = text.partition(':')
+    if not separator:
+        raise ValueError(f"Expected a low:high range, got {text!r}")
+    try:
+        return (float(low) if low.strip() else None, float(high) if high.strip() else None)
+    except ValueError:
+        raise ValueError(f"Range bounds must be numbers, got {text!r}") from None
+
+def query_from_params(params):
+    """query() arguments out of {name: [values]} parameters, as parsed from a query string
+
+    category, company and keyword may repeat; salary_min, salary_max, days_ago and
+    category_confidence take low:high ranges; sort names a numeric column, order is
+    asc or desc, and offset and limit page through the results. Any other parameter is
+    a ValueError, so a misspelled filter is not taken for a query matching everything.
+    """
+    unknown = sorted(set(params) - set(QUERY_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown query parameters: {', '.join(unknown)}; "
+                         f"expected {', '.join(QUERY_PARAMETERS)}")
+
+    def single(name, default=None):
+        values = params.get(name)
+        return values[-1] if values else default
+
+    arguments = {
+        'category': params.get('category') or None,
+        'company': params.get('company') or None,
+        'keywords': params.get('keyword') or None,
+        'ranges': {column: parse_range(single(column)) for column in NUMERIC_COLUMNS if single(column)},
+        'sort': single('sort'),
+        'descending': single('order', 'asc') == 'desc'
+    }
+    if single('order', 'asc') not in ('asc', 'desc'):
+        raise ValueError("order must be asc or desc")
+    try:
+        arguments['offset'] = int(single('offset', 0))
+        arguments['limit'] = min(int(single('limit', DEFAULT_LIMIT)), MAX_LIMIT)
+    except ValueError:
+        raise ValueError("offset and limit must be integers") from None
+    return arguments
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query categorized jobs with indexed filters")
+    parser.add_argument('input', nargs='?', default='complete_categorized_jobs.csv',
+                        help="pipeline output: csv, jsonl, arrow or npz (default: complete_categorized_jobs.csv)")
+    parser.add_argument('--category', action='append', help="category to match; repeat for any of several")
+    parser.add_argument('--company', action='append', help="company to match; repeat for any of several")
+    parser.add_argument('--keyword', action='append', help="title words that must all be present")
+    for column in NUMERIC_COLUMNS:
+        parser.add_argument(f"--{column.replace('_', '-')}", dest=column, metavar='LOW:HIGH',
+                            help=f"inclusive {column} range; either side may be empty")
+    parser.add_argument('--sort', choices=SORT_COLUMNS, help="numeric column to sort by (default: output order)")
+    parser.add_argument('--desc', action='store_true', help="sort in decreasing order")
+    parser.add_argument('--offset', type=int, default=0)
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help=f"jobs per page (default: {DEFAULT_LIMIT})")
+    parser.add_argument('--json', action='store_true', help="print the page as JSON lines")
+    args = parser.parse_args(argv)
+
+    params = {name: values for name, values in (('category', args.category), ('company', args.company),
+                                                ('keyword', args.keyword)) if values}
+    params.update({column: [getattr(args, column)] for column in NUMERIC_COLUMNS if getattr(args, column)})
+    params.update(sort=[args.sort] if args.sort else [], order=['desc' if args.desc else 'asc'],
+                  offset=[str(args.offset)], limit=[str(args.limit)])
+    try:
+        arguments = query_from_params(params)
+    except ValueError as error:
+        parser.error(str(error))
+
+    index = JobQueryIndex.from_output(args.input)
+    result = index.query(**arguments)
+    if args.json:
+        for job in result['jobs']:
+            print(json.dumps(job, ensure_ascii=False))
+        return result
+
+    last = result['offset'] + len(result['jobs'])
+    print(f"🔎 {result['total']} matching jobs; showing {result['offset'] + 1 if result['jobs'] else 0}-{last}")
+    for job in result['jobs']:
+        salary = f"${job['salary_min']:,.0f}" if job['salary_min'] is not None else '-'
+        days = f"{job['days_ago']:g}d" if job['days_ago'] is not None else '-'
+        print(f"   {salary:>9} {days:>6}  {job['category']:<22} {job['company'][:24]:<24} {job['title'][:70]}")
+    return result
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,55 @@ function parseCSVLine(line: string): string[] {
   return result.map(field => field.replace(/^"|"$/g, '')); // Remove outer quotes
 }
 
+// Aggregates precomputed by categorize_jobs.py, used when they are at least as new as the CSV
+const SUMMARY_VERSION = 1;
+
+async function readSummary(csvPath: string) {
+  const summaryPath = csvPath.replace(/\.csv$/, '.summary.json');
+  try {
+    const [summaryStat, csvStat] = await Promise.all([fs.stat(summaryPath), fs.stat(csvPath)]);
+    if (summaryStat.mtimeMs < csvStat.mtimeMs) {
+      return null;
+    }
+    const summary = JSON.parse(await fs.readFile(summaryPath, 'utf-8'));
+    return summary.version === SUMMARY_VERSION ? summary : null;
+  } catch {
+    return null; // No summary yet, fall back to computing the aggregates
+  }
+}
+
+// Rule dictionary resolving the rule keys in matched_keywords (see CategoryRules.dictionary)
+const RULE_DICTIONARY_VERSION = 2;
+
+async function readRuleLabels(csvPath: string) {
+  const dictionaryPath = csvPath.replace(/\.csv$/, '.rules.json');
+  try {
+    const dictionary = JSON.parse(await fs.readFile(dictionaryPath, 'utf-8'));
+    if (dictionary.version !== RULE_DICTIONARY_VERSION) {
+      return null;
+    }
+    const labels = new Map<string, string[]>();
+    for (const rule of dictionary.rules) {
+      labels.set(rule.id, Array(rule.repeat).fill(rule.label));
+    }
+    return labels;
+  } catch {
+    return null; // No dictionary (verbose matches), keep the values as they are
+  }
+}
+
+// 'key;key' -> 'keyword; keyword', leaving values with unknown keys untouched
+function expandMatches(value: string, labels: Map<string, string[]>) {
+  if (!value) {
+    return value;
+  }
+  const keys = value.split(';');
+  if (!keys.every(key => labels.has(key))) {
+    return value;
+  }
+  return keys.flatMap(key => labels.get(key)!).join('; ');
+}
+
 export async function GET() {
   try {
     // Read the CSV file
@@ -65,11 +114,19 @@ export async function GET() {
         return job as unknown as Job;
       });
 
-    // Process the data into the native format
-    const metrics = calculateMetrics(jobs);
-    const categoryStats = calculateCategoryStats(jobs);
-    const topOpportunities = calculateTopOpportunities(jobs);
-    const technologyInsights = calculateTechnologyInsights(jobs);
+    const ruleLabels = await readRuleLabels(csvPath);
+    if (ruleLabels) {
+      for (const job of jobs) {
+        job.matched_keywords = expandMatches(job.matched_keywords, ruleLabels);
+      }
+    }
+
+    // Process the data into the native format, preferring the precomputed aggregates
+    const summary = await readSummary(csvPath);
+    const metrics = summary?.metrics ?? calculateMetrics(jobs);
+    const categoryStats = summary?.categoryStats ?? calculateCategoryStats(jobs);
+    const topOpportunities = summary?.topOpportunities ?? calculateTopOpportunities(jobs);
+    const technologyInsights = summary?.technologyInsights ?? calculateTechnologyInsights(jobs);
     const recommendations = generateRecommendations(metrics, categoryStats);
 
     const jobMarketData: JobMarketData = {
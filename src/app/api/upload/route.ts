@@ -175,6 +175,32 @@ function processJobLines(lines: string[]): Job | null {
   };
 }
 
+// Parse and categorize a TXT dump with the Python pipeline when its server is running
+// (python categorize_server.py; CATEGORIZER_URL=http://127.0.0.1:8765)
+async function parseTxtWithCategorizer(content: string): Promise<Job[] | null> {
+  const url = process.env.CATEGORIZER_URL;
+  if (!url) return null;
+  
+  try {
+    const response = await fetch(`${url}/categorize`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ text: content, verbose: true })
+    });
+    if (!response.ok) return null;
+    const data = await response.json();
+    return (data.jobs as Job[]).map(job => ({
+      ...job,
+      salary_min: job.salary_min ?? undefined,
+      salary_max: job.salary_max ?? undefined,
+      days_ago: job.days_ago ?? undefined
+    }));
+  } catch (error) {
+    console.error('Categorizer server unavailable, using the built-in parser:', error);
+    return null;
+  }
+}
+
 // Parse CSV file content
 function parseCsvContent(content: string): Job[] {
   const lines = content.split('\n');
@@ -247,7 +273,7 @@ export async function POST(request: NextRequest) {
     // Parse based on file type
     let jobs: Job[];
     if (file.name.toLowerCase().endsWith('.txt')) {
-      jobs = parseTxtContent(content);
+      jobs = (await parseTxtWithCategorizer(content)) ?? parseTxtContent(content);
     } else if (file.name.toLowerCase().endsWith('.csv')) {
       jobs = parseCsvContent(content);
     } else {
@@ -255,7 +281,7 @@ export async function POST(request: NextRequest) {
       if (content.includes(',') && content.split('\n')[0].includes(',')) {
         jobs = parseCsvContent(content);
       } else {
-        jobs = parseTxtContent(content);
+        jobs = (await parseTxtWithCategorizer(content)) ?? parseTxtContent(content);
       }
     }
     
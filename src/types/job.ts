@@ -10,6 +10,8 @@ export interface Job {
   days_ago?: number;
   category: string;
   category_confidence: number;
+  // Matched keywords joined with '; '. The CSV stores rule keys joined with ';'
+  // (8 hex digits each, see <output>.rules.json), which /api/jobs expands
   matched_keywords: string;
   country?: string; // Add country field
 }
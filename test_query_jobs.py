@@ -0,0 +1,20 @@
+from urllib.parse import parse_qs
+
+from query_jobs import query_from_params
+
+# Query strings as GET /jobs receives them
+print("Testing query parameters:")
+arguments = query_from_params(parse_qs('category=Sales&salary_min=1000:&sort=salary_min&order=desc&limit=5'))
+print(f"category=Sales&salary_min=1000:&sort=salary_min&order=desc&limit=5 -> {arguments}")
+assert arguments['category'] == ['Sales']
+assert arguments['ranges'] == {'salary_min': (1000.0, None)}
+assert arguments['descending'] and arguments['limit'] == 5
+
+# A misspelled or unknown filter must not be taken for a query matching every job
+for query in ['q=python', 'categroy=Sales', 'category=Sales&salary=1000:']:
+    try:
+        query_from_params(parse_qs(query))
+    except ValueError as error:
+        print(f"{query} -> rejected: {error}")
+    else:
+        raise AssertionError(f"{query!r} was accepted")